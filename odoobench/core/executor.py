@@ -4,13 +4,165 @@ Provides a unified interface for executing commands on local or remote machines
 """
 
 import subprocess
+import hashlib
 import os
+import shlex
+import shutil
+import socket
+import stat
+import atexit
+import queue
+import threading
 from abc import ABC, abstractmethod
-from typing import Iterator, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+import io
 import paramiko
 from io import StringIO
 
 
+class SSHConnectionPool:
+    """
+    Thread-safe pool of authenticated SSH clients
+
+    Clients are grouped by a (host, port, username, key_path, password hash)
+    key so that short-lived executors for the same server and credentials
+    reuse one transport instead of paying a full TCP + key exchange handshake
+    each time.
+    """
+
+    def __init__(self, max_connections: int = 8):
+        """
+        Initialize the pool
+
+        Args:
+            max_connections: Maximum idle clients kept per key
+        """
+        self.max_connections = max_connections
+        self._pools: Dict[tuple, queue.Queue] = {}
+        self._lock = threading.Lock()
+
+    def _get_queue(self, key: tuple) -> queue.Queue:
+        """Get or create the idle queue for a key"""
+        with self._lock:
+            idle = self._pools.get(key)
+            if idle is None:
+                idle = queue.Queue(maxsize=self.max_connections)
+                self._pools[key] = idle
+            return idle
+
+    @staticmethod
+    def _is_alive(client: paramiko.SSHClient) -> bool:
+        """Check that a client's transport is still usable"""
+        transport = client.get_transport()
+        if transport is None or not transport.is_active():
+            return False
+        try:
+            transport.send_ignore()
+        except Exception:
+            return False
+        return True
+
+    @staticmethod
+    def _close(client: paramiko.SSHClient) -> None:
+        """Close a client, ignoring errors"""
+        try:
+            client.close()
+        except Exception:
+            pass
+
+    def acquire(self, key: tuple, factory: Callable[[], paramiko.SSHClient]) -> paramiko.SSHClient:
+        """
+        Get a connected client for a key
+
+        Args:
+            key: Connection identity tuple
+            factory: Callable that opens a new connected client
+
+        Returns:
+            A pooled client if a live one is idle, otherwise a new one
+        """
+        idle = self._get_queue(key)
+        while True:
+            try:
+                client = idle.get_nowait()
+            except queue.Empty:
+                return factory()
+            if self._is_alive(client):
+                return client
+            self._close(client)
+
+    def release(self, key: tuple, client: paramiko.SSHClient) -> None:
+        """
+        Return a client to the pool, closing it if dead or the pool is full
+
+        Args:
+            key: Connection identity tuple
+            client: Client previously obtained from acquire()
+        """
+        if not self._is_alive(client):
+            self._close(client)
+            return
+        try:
+            self._get_queue(key).put_nowait(client)
+        except queue.Full:
+            self._close(client)
+
+    def close_all(self) -> None:
+        """Close every idle client in the pool"""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for idle in pools:
+            while True:
+                try:
+                    self._close(idle.get_nowait())
+                except queue.Empty:
+                    break
+
+
+# Process-wide pool shared by all SSH executors
+_ssh_pool = SSHConnectionPool()
+atexit.register(_ssh_pool.close_all)
+
+
+def _tail_bytes(path: str, n_lines: int, block_size: int = 65536) -> bytes:
+    """
+    Read the last N lines of a file by seeking backwards from the end
+
+    Args:
+        path: Path to the file
+        n_lines: Number of lines to return
+        block_size: Bytes to read per backward step
+
+    Returns:
+        Raw bytes of the last N lines
+    """
+    if n_lines <= 0:
+        return b''
+
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        chunks = []
+        newlines = 0
+        # Stop once we have seen more newlines than lines wanted, so the
+        # first kept line is complete even when the file ends with '\n'
+        while pos > 0 and newlines <= n_lines:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            chunk = f.read(read_size)
+            newlines += chunk.count(b'\n')
+            chunks.append(chunk)
+
+    data = b''.join(reversed(chunks))
+    start = len(data) - 1 if data.endswith(b'\n') else len(data)
+    for _ in range(n_lines):
+        start = data.rfind(b'\n', 0, start)
+        if start < 0:
+            break
+    return data[start + 1:]
+
+
 class ConnectionExecutor(ABC):
     """Abstract base class for executing commands on local or remote machines"""
 
@@ -105,13 +257,85 @@ class ConnectionExecutor(ABC):
         """Close the connection"""
         pass
 
+    @property
+    def home_dir(self) -> str:
+        """Home directory of the executing user (looked up once, then cached)"""
+        home = getattr(self, '_home', None)
+        if home is None:
+            stdout, stderr, code = self.run_command("echo $HOME")
+            home = stdout.strip() if code == 0 and stdout.strip() else os.path.expanduser("~")
+            self._home = home
+        return home
+
+    def run_argv(self, argv: list, timeout: int = 30,
+                 env: Optional[Dict[str, str]] = None) -> Tuple[str, str, int]:
+        """
+        Execute a pre-tokenized command and return (stdout, stderr, exit_code)
+
+        Arguments are passed through verbatim, so no shell quoting is needed.
+
+        Args:
+            argv: Command and arguments
+            timeout: Command timeout in seconds
+            env: Extra environment variables for the command
+
+        Returns:
+            Tuple of (stdout, stderr, exit_code)
+        """
+        cmd = shlex.join(argv)
+        if env:
+            assignments = ' '.join(f'{name}={shlex.quote(value)}' for name, value in env.items())
+            cmd = f'{assignments} {cmd}'
+        return self.run_command(cmd, timeout=timeout)
+
+    def open_text(self, path: str):
+        """
+        Open a file for streaming text reads
+
+        Args:
+            path: Absolute path to the file
+
+        Returns:
+            Readable text file object (use as a context manager)
+        """
+        return StringIO(self.read_file(path))
+
+    def read_file_lines(self, path: str) -> Iterator[str]:
+        """
+        Yield the lines of a text file one at a time
+
+        Args:
+            path: Absolute path to the file
+
+        Returns:
+            Iterator over lines, including their line endings
+        """
+        with self.open_text(path) as f:
+            yield from f
+
     def get_file_size(self, path: str) -> int:
         """Get file size in bytes"""
-        stdout, stderr, code = self.run_command(f"stat -c%s '{path}' 2>/dev/null || stat -f%z '{path}'")
+        stdout, stderr, code = self.run_argv(['stat', '-c%s', path])
+        if code != 0:
+            # BSD stat uses a different format flag
+            stdout, stderr, code = self.run_argv(['stat', '-f%z', path])
         if code == 0 and stdout.strip():
             return int(stdout.strip())
         return 0
 
+    def get_mtime(self, path: str) -> Optional[float]:
+        """Get file modification time as a Unix timestamp, or None if unavailable"""
+        stdout, stderr, code = self.run_argv(['stat', '-c%Y', path])
+        if code != 0:
+            # BSD stat uses a different format flag
+            stdout, stderr, code = self.run_argv(['stat', '-f%m', path])
+        if code == 0 and stdout.strip():
+            try:
+                return float(stdout.strip())
+            except ValueError:
+                pass
+        return None
+
     def list_directory(self, path: str) -> list:
         """List files in a directory"""
         stdout, stderr, code = self.run_command(f"ls -la '{path}'")
@@ -119,6 +343,84 @@ class ConnectionExecutor(ABC):
             return stdout.strip().split('\n')
         return []
 
+    def disk_usage(self, path: str) -> Dict[str, Any]:
+        """
+        Get disk usage for the filesystem containing a path
+
+        Args:
+            path: Absolute path on the filesystem
+
+        Returns:
+            Dictionary with total, used, available in bytes and percent_used,
+            or an empty dictionary if it cannot be determined
+        """
+        stdout, stderr, code = self.run_argv(['df', '-B1', path])
+
+        if code != 0 or not stdout.strip():
+            return {}
+
+        parts = stdout.strip().split('\n')[-1].split()
+        if len(parts) >= 5:
+            return {
+                'total': int(parts[1]),
+                'used': int(parts[2]),
+                'available': int(parts[3]),
+                'percent_used': parts[4].rstrip('%'),
+            }
+
+        return {}
+
+    def run_script(self, source: str, timeout: int = 30) -> Dict[str, str]:
+        """
+        Run a shell script that prints 'key=value' lines and collect them
+
+        Lets several small checks share a single command round-trip.
+
+        Args:
+            source: Shell script source
+            timeout: Command timeout in seconds
+
+        Returns:
+            Dictionary of printed keys to values (empty if the script failed)
+        """
+        stdout, stderr, code = self.run_command(source, timeout=timeout)
+        values = {}
+        if code == 0:
+            for line in stdout.split('\n'):
+                key, sep, value = line.partition('=')
+                if sep:
+                    values[key] = value
+        return values
+
+    def batch_stat(self, paths: list) -> Dict[str, str]:
+        """
+        Check the type of several paths in a single command
+
+        Args:
+            paths: Absolute paths to check
+
+        Returns:
+            Dictionary mapping each path to 'F' (file), 'D' (directory) or 'N' (missing)
+        """
+        if not paths:
+            return {}
+
+        quoted = ' '.join(shlex.quote(p) for p in paths)
+        cmd = (
+            f'for p in {quoted}; do '
+            f'if [ -f "$p" ]; then echo "F:$p"; '
+            f'elif [ -d "$p" ]; then echo "D:$p"; '
+            f'else echo "N:$p"; fi; done'
+        )
+        stdout, stderr, code = self.run_command(cmd)
+
+        result = {path: 'N' for path in paths}
+        if code == 0:
+            for line in stdout.split('\n'):
+                if len(line) > 2 and line[1] == ':' and line[2:] in result:
+                    result[line[2:]] = line[0]
+        return result
+
 
 class LocalExecutor(ConnectionExecutor):
     """Execute commands on the local machine"""
@@ -126,6 +428,11 @@ class LocalExecutor(ConnectionExecutor):
     def __init__(self):
         self._tail_running = False
 
+    @property
+    def home_dir(self) -> str:
+        """Local home directory, without spawning a shell"""
+        return os.path.expanduser("~")
+
     def run_command(self, cmd: str, timeout: int = 30) -> Tuple[str, str, int]:
         """Execute a command locally"""
         try:
@@ -142,6 +449,23 @@ class LocalExecutor(ConnectionExecutor):
         except Exception as e:
             return "", str(e), -1
 
+    def run_argv(self, argv: list, timeout: int = 30,
+                 env: Optional[Dict[str, str]] = None) -> Tuple[str, str, int]:
+        """Execute a command locally without spawning a shell"""
+        try:
+            result = subprocess.run(
+                argv,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                env={**os.environ, **env} if env else None
+            )
+            return result.stdout, result.stderr, result.returncode
+        except subprocess.TimeoutExpired:
+            return "", "Command timed out", -1
+        except Exception as e:
+            return "", str(e), -1
+
     def read_file(self, path: str) -> str:
         """Read a local file"""
         try:
@@ -150,6 +474,13 @@ class LocalExecutor(ConnectionExecutor):
         except Exception as e:
             raise IOError(f"Failed to read file {path}: {e}")
 
+    def open_text(self, path: str):
+        """Open a local file for streaming text reads"""
+        try:
+            return open(path, 'r')
+        except Exception as e:
+            raise IOError(f"Failed to read file {path}: {e}")
+
     def write_file(self, path: str, content: str) -> bool:
         """Write to a local file"""
         try:
@@ -167,43 +498,161 @@ class LocalExecutor(ConnectionExecutor):
         """Check if local directory exists"""
         return os.path.isdir(path)
 
+    def get_mtime(self, path: str) -> Optional[float]:
+        """Get local file modification time"""
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+
+    def disk_usage(self, path: str) -> Dict[str, Any]:
+        """Get local disk usage via statvfs instead of running df"""
+        try:
+            usage = shutil.disk_usage(path)
+        except OSError:
+            return {}
+
+        # Match df's Use% (rounded up, relative to space usable by non-root)
+        usable = usage.used + usage.free
+        percent = -(-usage.used * 100 // usable) if usable else 0
+        return {
+            'total': usage.total,
+            'used': usage.used,
+            'available': usage.free,
+            'percent_used': str(percent),
+        }
+
+    def batch_stat(self, paths: list) -> Dict[str, str]:
+        """Check the type of several local paths without spawning a shell"""
+        result = {}
+        for path in paths:
+            if os.path.isfile(path):
+                result[path] = 'F'
+            elif os.path.isdir(path):
+                result[path] = 'D'
+            else:
+                result[path] = 'N'
+        return result
+
     def tail_file(self, path: str, lines: int = 100) -> str:
         """Get last N lines of a local file"""
-        stdout, stderr, code = self.run_command(f"tail -n {lines} '{path}'")
-        if code == 0:
-            return stdout
-        raise IOError(f"Failed to tail file {path}: {stderr}")
+        try:
+            return _tail_bytes(path, lines).decode('utf-8', errors='replace')
+        except OSError as e:
+            raise IOError(f"Failed to tail file {path}: {e}")
 
     def tail_file_follow(self, path: str, callback) -> None:
-        """Follow a local file with tail -f"""
-        import threading
-
+        """Follow a local file, using inotify when available (tail -F semantics)"""
         self._tail_running = True
 
-        def follow():
-            try:
-                process = subprocess.Popen(
-                    ['tail', '-f', path],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-                self._tail_process = process
+        try:
+            import inotify_simple
+        except ImportError:
+            inotify_simple = None
 
-                while self._tail_running:
-                    line = process.stdout.readline()
-                    if line:
-                        callback(line.rstrip('\n'))
-                    elif process.poll() is not None:
-                        break
-
-                process.terminate()
-            except Exception as e:
-                callback(f"Error following file: {e}")
+        if inotify_simple is not None:
+            def follow():
+                self._follow_inotify(inotify_simple, path, callback)
+        else:
+            def follow():
+                self._follow_subprocess(path, callback)
 
         self._tail_thread = threading.Thread(target=follow, daemon=True)
         self._tail_thread.start()
 
+    def _follow_inotify(self, inotify_simple, path: str, callback) -> None:
+        """Follow a file with inotify, reopening it when the log is rotated"""
+        import time
+
+        flags = inotify_simple.flags
+        # rm only drops a link while this thread holds the file open, so
+        # DELETE_SELF never comes; the link count change raises ATTRIB
+        watch_flags = flags.MODIFY | flags.ATTRIB | flags.MOVE_SELF | flags.DELETE_SELF
+        inotify = inotify_simple.INotify()
+        f = None
+        buffer = b''
+
+        try:
+            f = open(path, 'rb')
+            f.seek(0, os.SEEK_END)
+            wd = inotify.add_watch(path, watch_flags)
+
+            while self._tail_running:
+                rotated = False
+                for event in inotify.read(timeout=500):
+                    # Skip events still queued for the watch on a rotated file
+                    if event.wd == wd and event.mask & (flags.MOVE_SELF | flags.DELETE_SELF):
+                        rotated = True
+
+                # The path no longer names the open file: removed or replaced
+                file_stat = os.fstat(f.fileno())
+                if not rotated:
+                    try:
+                        rotated = not os.path.samestat(file_stat, os.stat(path))
+                    except FileNotFoundError:
+                        rotated = True
+
+                # Handle copytruncate-style rotation
+                if file_stat.st_size < f.tell():
+                    f.seek(0)
+
+                # Drain new data (including the tail of a rotated file)
+                data = f.read()
+                if data:
+                    buffer += data
+                    *lines, buffer = buffer.split(b'\n')
+                    for line in lines:
+                        callback(line.decode('utf-8', errors='replace'))
+
+                if rotated:
+                    f.close()
+                    f = None
+                    try:
+                        inotify.rm_watch(wd)
+                    except OSError:
+                        pass  # Watch is already gone if the file was deleted
+                    while self._tail_running and not os.path.exists(path):
+                        time.sleep(0.5)
+                    if not self._tail_running:
+                        break
+                    f = open(path, 'rb')
+                    wd = inotify.add_watch(path, watch_flags)
+                    buffer = b''
+        except Exception as e:
+            if self._tail_running:
+                callback(f"Error following file: {e}")
+        finally:
+            if f:
+                f.close()
+            inotify.close()
+
+    def _follow_subprocess(self, path: str, callback) -> None:
+        """Follow a file with a tail -f subprocess (fallback without inotify)"""
+        try:
+            process = subprocess.Popen(
+                ['tail', '-n', '0', '-f', path],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=65536
+            )
+            self._tail_process = process
+
+            buffer = b''
+            while self._tail_running:
+                # read1() returns whatever is available (up to 64 KiB) in one syscall
+                chunk = process.stdout.read1(65536)
+                if not chunk:
+                    break  # EOF: tail exited
+                buffer += chunk
+                if b'\n' in buffer:
+                    *lines, buffer = buffer.split(b'\n')
+                    for line in lines:
+                        callback(line.decode('utf-8', errors='replace'))
+
+            process.terminate()
+        except Exception as e:
+            callback(f"Error following file: {e}")
+
     def stop_tail(self) -> None:
         """Stop the tail follow operation"""
         self._tail_running = False
@@ -226,7 +675,8 @@ class SSHExecutor(ConnectionExecutor):
     """Execute commands on a remote machine via SSH"""
 
     def __init__(self, host: str, port: int = 22, username: str = None,
-                 password: str = None, key_path: str = None):
+                 password: str = None, key_path: str = None,
+                 pool: Optional[SSHConnectionPool] = None):
         """
         Initialize SSH connection
 
@@ -236,28 +686,48 @@ class SSHExecutor(ConnectionExecutor):
             username: SSH username
             password: SSH password (if using password auth)
             key_path: Path to SSH private key (if using key auth)
+            pool: Optional connection pool to borrow the client from
         """
         self.host = host
         self.port = port
         self.username = username
         self.password = password
         self.key_path = key_path
+        self._pool = pool
+        # Include the password (hashed) so a pooled client authenticated with
+        # other credentials is never handed to this executor
+        password_hash = hashlib.sha256(password.encode('utf-8')).hexdigest() if password else None
+        self._pool_key = (host, port, username, key_path, password_hash)
 
         self._client: Optional[paramiko.SSHClient] = None
         self._sftp: Optional[paramiko.SFTPClient] = None
+        self._home: Optional[str] = None
         self._tail_running = False
         self._tail_channel = None
+        # Serializes (re)connecting when the executor is shared between threads
+        self._connect_lock = threading.RLock()
 
     def _ensure_connected(self) -> paramiko.SSHClient:
         """Ensure SSH connection is established"""
-        if self._client is None or not self._client.get_transport() or not self._client.get_transport().is_active():
-            self._connect()
-        return self._client
-
-    def _connect(self) -> None:
-        """Establish SSH connection"""
-        self._client = paramiko.SSHClient()
-        self._client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        with self._connect_lock:
+            transport = self._client.get_transport() if self._client is not None else None
+            if transport is None or not transport.is_active():
+                if self._client is not None:
+                    try:
+                        self._client.close()
+                    except Exception:
+                        pass
+                    self._sftp = None
+                if self._pool is not None:
+                    self._client = self._pool.acquire(self._pool_key, self._open_client)
+                else:
+                    self._client = self._open_client()
+            return self._client
+
+    def _open_client(self) -> paramiko.SSHClient:
+        """Open a new authenticated SSH client"""
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
         connect_kwargs = {
             'hostname': self.host,
@@ -270,14 +740,25 @@ class SSHExecutor(ConnectionExecutor):
         elif self.password:
             connect_kwargs['password'] = self.password
 
-        self._client.connect(**connect_kwargs)
+        client.connect(banner_timeout=15, auth_timeout=15, **connect_kwargs)
+
+        # Keep idle pooled connections alive through firewalls/NAT
+        transport = client.get_transport()
+        transport.set_keepalive(30)
+        sock = transport.sock
+        if isinstance(sock, socket.socket):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, 'TCP_KEEPIDLE'):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60)
+        return client
 
     def _get_sftp(self) -> paramiko.SFTPClient:
         """Get or create SFTP client"""
-        self._ensure_connected()
-        if self._sftp is None:
-            self._sftp = self._client.open_sftp()
-        return self._sftp
+        with self._connect_lock:
+            self._ensure_connected()
+            if self._sftp is None:
+                self._sftp = self._client.open_sftp()
+            return self._sftp
 
     def run_command(self, cmd: str, timeout: int = 30) -> Tuple[str, str, int]:
         """Execute a command remotely via SSH"""
@@ -298,10 +779,22 @@ class SSHExecutor(ConnectionExecutor):
         try:
             sftp = self._get_sftp()
             with sftp.open(path, 'r') as f:
+                # Pipeline the SFTP read requests instead of one round-trip per block
+                f.prefetch()
                 return f.read().decode('utf-8', errors='replace')
         except Exception as e:
             raise IOError(f"Failed to read remote file {path}: {e}")
 
+    def open_text(self, path: str):
+        """Open a remote file via SFTP for streaming text reads"""
+        try:
+            sftp = self._get_sftp()
+            f = sftp.open(path, 'rb', bufsize=32768)
+            f.prefetch()
+            return io.TextIOWrapper(f, encoding='utf-8', errors='replace')
+        except Exception as e:
+            raise IOError(f"Failed to read remote file {path}: {e}")
+
     def write_file(self, path: str, content: str) -> bool:
         """Write to a remote file via SFTP"""
         try:
@@ -314,53 +807,81 @@ class SSHExecutor(ConnectionExecutor):
 
     def file_exists(self, path: str) -> bool:
         """Check if remote file exists"""
-        stdout, stderr, code = self.run_command(f"test -f '{path}' && echo 1 || echo 0")
-        return stdout.strip() == '1'
+        try:
+            return stat.S_ISREG(self._get_sftp().stat(path).st_mode)
+        except Exception:
+            return False
 
     def dir_exists(self, path: str) -> bool:
         """Check if remote directory exists"""
-        stdout, stderr, code = self.run_command(f"test -d '{path}' && echo 1 || echo 0")
-        return stdout.strip() == '1'
+        try:
+            return stat.S_ISDIR(self._get_sftp().stat(path).st_mode)
+        except Exception:
+            return False
+
+    def get_file_size(self, path: str) -> int:
+        """Get remote file size in bytes"""
+        try:
+            return self._get_sftp().stat(path).st_size or 0
+        except Exception:
+            return 0
+
+    def get_mtime(self, path: str) -> Optional[float]:
+        """Get remote file modification time"""
+        try:
+            return self._get_sftp().stat(path).st_mtime
+        except Exception:
+            return None
 
     def tail_file(self, path: str, lines: int = 100) -> str:
         """Get last N lines of a remote file"""
-        stdout, stderr, code = self.run_command(f"tail -n {lines} '{path}'")
+        stdout, stderr, code = self.run_argv(['tail', '-n', str(lines), path])
         if code == 0:
             return stdout
         raise IOError(f"Failed to tail remote file {path}: {stderr}")
 
     def tail_file_follow(self, path: str, callback) -> None:
         """Follow a remote file with tail -f"""
-        import threading
-
         self._tail_running = True
 
         def follow():
+            import select
+
+            channel = None
             try:
                 client = self._ensure_connected()
                 transport = client.get_transport()
-                self._tail_channel = transport.open_session()
-                self._tail_channel.exec_command(f"tail -f '{path}'")
-
-                buffer = ""
+                channel = transport.open_session()
+                self._tail_channel = channel
+                # Merge stderr (e.g. "file truncated") into the stream read
+                # below; unread stderr would keep select() returning at once
+                channel.set_combine_stderr(True)
+                channel.exec_command(f"tail -n 0 -f '{path}'")
+
+                buffer = b""
                 while self._tail_running:
-                    if self._tail_channel.recv_ready():
-                        data = self._tail_channel.recv(4096).decode('utf-8', errors='replace')
-                        buffer += data
-                        while '\n' in buffer:
-                            line, buffer = buffer.split('\n', 1)
-                            callback(line)
-                    elif self._tail_channel.exit_status_ready():
+                    # Block until data arrives instead of polling recv_ready()
+                    readable, _, _ = select.select([channel], [], [], 1.0)
+                    if not readable:
+                        continue
+
+                    while channel.recv_ready():
+                        buffer += channel.recv(65536)
+                    if b'\n' in buffer:
+                        *lines, buffer = buffer.split(b'\n')
+                        for line in lines:
+                            callback(line.decode('utf-8', errors='replace'))
+
+                    if channel.closed or channel.eof_received or channel.exit_status_ready():
                         break
-                    else:
-                        import time
-                        time.sleep(0.1)
 
             except Exception as e:
-                callback(f"Error following remote file: {e}")
+                if self._tail_running:
+                    callback(f"Error following remote file: {e}")
             finally:
-                if self._tail_channel:
-                    self._tail_channel.close()
+                if channel:
+                    channel.close()
+                if self._tail_channel is channel:
                     self._tail_channel = None
 
         self._tail_thread = threading.Thread(target=follow, daemon=True)
@@ -384,7 +905,7 @@ class SSHExecutor(ConnectionExecutor):
         return transport is not None and transport.is_active()
 
     def disconnect(self) -> None:
-        """Close SSH connection"""
+        """Close SSH connection, returning it to the pool if one is used"""
         self.stop_tail()
         if self._sftp:
             try:
@@ -393,10 +914,13 @@ class SSHExecutor(ConnectionExecutor):
                 pass
             self._sftp = None
         if self._client:
-            try:
-                self._client.close()
-            except:
-                pass
+            if self._pool is not None:
+                self._pool.release(self._pool_key, self._client)
+            else:
+                try:
+                    self._client.close()
+                except:
+                    pass
             self._client = None
 
 
@@ -421,11 +945,12 @@ def create_executor(connection_config: dict) -> ConnectionExecutor:
     if is_local or (host in ('localhost', '127.0.0.1') and not username):
         return LocalExecutor()
 
-    # Otherwise use SSH
+    # Otherwise use SSH, sharing authenticated transports via the process-wide pool
     return SSHExecutor(
         host=host,
         port=connection_config.get('port', 22),
         username=username,
         password=connection_config.get('password'),
-        key_path=connection_config.get('key_path') or connection_config.get('ssh_key_path')
+        key_path=connection_config.get('key_path') or connection_config.get('ssh_key_path'),
+        pool=_ssh_pool
     )
@@ -3,10 +3,28 @@ Odoo Configuration Parser for OdooBench
 Parses odoo.conf files and discovers Odoo instance settings
 """
 
-import configparser
+import fnmatch
 import os
-from typing import Dict, Any, Optional
-from .executor import ConnectionExecutor
+import re
+import shlex
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+from .executor import ConnectionExecutor, LocalExecutor, create_executor
+
+# Odoo major versions (12.0 - 18.0) embedded in an addons path
+_VERSION_RE = re.compile(r'(?<![\d.])(1[2-8]\.0)(?!\d)')
+
+# PostgreSQL major version in a psql binary path
+_PSQL_PATH_VERSION_RE = re.compile(r'/(?:pgsql-|postgresql/)(\d+)')
+
+# odoo.conf placeholders meaning "not set" (compared lowercased)
+_UNSET_VALUES = frozenset(('false', 'none', ''))
+
+# Marks a finder result that has not been computed yet (None means "not found")
+_NOT_SEARCHED = object()
 
 
 class OdooConfigParser:
@@ -30,6 +48,55 @@ class OdooConfigParser:
         '/opt/odoo/odoo.log',
     ]
 
+    # Default filestore locations to check ('~' is the target user's home)
+    DEFAULT_FILESTORE_PATHS = [
+        '/var/lib/odoo',
+        '~/.local/share/Odoo',
+        '/opt/odoo/.local/share/Odoo',
+    ]
+
+    # Common psql install locations in order of preference, checked before
+    # falling back to PATH; globs cover every installed PostgreSQL version
+    COMMON_PSQL_PATHS = (
+        '/usr/bin/psql',
+        '/usr/local/bin/psql',
+        '/usr/pgsql-*/bin/psql',
+        '/usr/lib/postgresql/*/bin/psql',
+        '/opt/postgresql/bin/psql',
+    )
+
+    # odoo.conf options extracted by parse_config: (result key, option name, default)
+    _RAW_OPTIONS = (
+        ('db_host', 'db_host', 'localhost'),
+        ('db_user', 'db_user', 'odoo'),
+    )
+    # Options where Odoo's 'False'/'None' placeholders mean "not set"
+    _CLEANED_OPTIONS = (
+        ('db_password', 'db_password'),
+        ('db_name', 'db_name'),
+        ('filestore_path', 'data_dir'),
+        ('log_path', 'logfile'),
+        ('addons_path', 'addons_path'),
+    )
+    _INT_OPTIONS = (
+        ('db_port', 'db_port', 5432),
+        ('workers', 'workers', 0),
+    )
+    # Every option parse_config reads; anything else in the file is skipped
+    _WANTED_OPTIONS = frozenset(
+        [option[1] for option in _RAW_OPTIONS + _CLEANED_OPTIONS + _INT_OPTIONS]
+        + ['http_port', 'xmlrpc_port']
+    )
+
+    # Seconds a cached path probe result stays valid
+    STAT_CACHE_TTL = 5.0
+
+    # Seconds to skip re-parsing an odoo.conf that failed to parse
+    CONF_FAILURE_TTL = 60.0
+
+    # Seconds a successful database connection check stays valid
+    CONN_CHECK_TTL = 30.0
+
     def __init__(self, executor: ConnectionExecutor):
         """
         Initialize parser with a connection executor
@@ -38,6 +105,56 @@ class OdooConfigParser:
             executor: ConnectionExecutor for local or SSH access
         """
         self.executor = executor
+        # Path type cache filled by batched probes: path -> (checked_at, 'F'/'D'/'N')
+        self._path_types: Dict[str, Tuple[float, str]] = {}
+        # Memoized finder results; a parser is per-connection and short-lived
+        self._found_conf = _NOT_SEARCHED
+        self._conf_candidates: Optional[List[str]] = None
+        self._home: Optional[str] = None
+        self._found_logs: Dict[Optional[str], Optional[str]] = {}
+        self._psql: Optional[Tuple[str, bool]] = None
+        # Configs that could not be parsed: conf path -> monotonic time of failure
+        self._conf_parse_failures: Dict[str, float] = {}
+        # Parsed configs: conf path -> (mtime, parse_config result)
+        self._conf_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # Open psycopg2 connections: (host, port, user, password, db) -> connection
+        self._pg_conns: Dict[tuple, Any] = {}
+        # Last successful connection per (host, port, user, password) -> monotonic time
+        self._conn_ok: Dict[tuple, float] = {}
+        # Guards the psql and connection caches for concurrent queries
+        self._pg_lock = threading.Lock()
+
+    def clear_stat_cache(self) -> None:
+        """Forget cached path probes and discovery results"""
+        self._path_types.clear()
+        self._found_conf = _NOT_SEARCHED
+        self._found_logs.clear()
+        self._conf_parse_failures.clear()
+        self._psql = None
+
+    def _probe_paths(self, paths: list) -> None:
+        """Check all unknown or expired paths in a single executor round-trip"""
+        now = time.monotonic()
+        missing = [
+            p for p in dict.fromkeys(paths)
+            if p not in self._path_types or now - self._path_types[p][0] > self.STAT_CACHE_TTL
+        ]
+        if missing:
+            for path, kind in self.executor.batch_stat(missing).items():
+                self._path_types[path] = (now, kind)
+
+    def _path_type(self, path: str) -> str:
+        """Get 'F', 'D' or 'N' for a path, using the probe cache"""
+        self._probe_paths([path])
+        return self._path_types.get(path, (0.0, 'N'))[1]
+
+    def _is_file(self, path: str) -> bool:
+        """Check if a path is a file, using the probe cache"""
+        return self._path_type(path) == 'F'
+
+    def _is_dir(self, path: str) -> bool:
+        """Check if a path is a directory, using the probe cache"""
+        return self._path_type(path) == 'D'
 
     def find_odoo_conf(self) -> Optional[str]:
         """
@@ -46,34 +163,111 @@ class OdooConfigParser:
         Returns:
             Path to odoo.conf if found, None otherwise
         """
-        for path in self.DEFAULT_CONF_PATHS:
-            expanded = os.path.expanduser(path)
-            if self.executor.file_exists(expanded):
-                return expanded
-        return None
+        if self._found_conf is not _NOT_SEARCHED:
+            return self._found_conf
+
+        self._found_conf = None
+        candidates = self._get_conf_candidates()
+        self._probe_paths(candidates)
+        for path in candidates:
+            if self._is_file(path):
+                self._found_conf = path
+                break
+        return self._found_conf
+
+    def _expand_home(self, paths: List[str]) -> List[str]:
+        """Resolve leading '~/' against the target's home directory"""
+        expanded = []
+        for path in paths:
+            if path.startswith('~/'):
+                if self._home is None:
+                    self._home = self.executor.home_dir
+                path = self._home + path[1:]
+            expanded.append(path)
+        return expanded
+
+    def _get_conf_candidates(self) -> List[str]:
+        """DEFAULT_CONF_PATHS with '~' resolved, computed once"""
+        if self._conf_candidates is None:
+            self._conf_candidates = self._expand_home(self.DEFAULT_CONF_PATHS)
+        return self._conf_candidates
+
+    def _probe_discovery_paths(self, conf_path: Optional[str]) -> None:
+        """
+        Probe every path discover_all may look at
 
-    def find_log_file(self, conf_path: Optional[str] = None) -> Optional[str]:
+        For remote targets whose home directory is not known yet, $HOME is
+        read in the same shell script as the path checks, so discovery costs
+        one round-trip instead of two.
+        """
+        explicit = [conf_path] if conf_path else []
+        templates = self.DEFAULT_CONF_PATHS + self.DEFAULT_LOG_PATHS + self.DEFAULT_FILESTORE_PATHS
+
+        if self._home is None and not isinstance(self.executor, LocalExecutor):
+            paths = [shlex.quote(path) for path in explicit] + [
+                '"$HOME"' + shlex.quote(path[1:]) if path.startswith('~/') else shlex.quote(path)
+                for path in templates
+            ]
+            checks = ''.join(
+                f'p={path}; if [ -f "$p" ]; then echo "{i}=F"; '
+                f'elif [ -d "$p" ]; then echo "{i}=D"; else echo "{i}=N"; fi; '
+                for i, path in enumerate(paths)
+            )
+            values = self.executor.run_script(f'echo "home=$HOME"; {checks}')
+            if values.get('home'):
+                self._home = values['home']
+                now = time.monotonic()
+                for i, path in enumerate(explicit + self._expand_home(templates)):
+                    self._path_types[path] = (now, values.get(str(i), 'N'))
+
+        # Fills in anything the script did not cover (a no-op when it did)
+        self._probe_paths(explicit + self._expand_home(templates))
+
+    def find_log_file(self, conf_path: Optional[str] = None,
+                      parsed: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """
         Find the Odoo log file
 
         Args:
             conf_path: Optional path to odoo.conf (will parse for logfile setting)
+            parsed: Optional parse_config() result to use instead of parsing again
 
         Returns:
             Path to log file if found
         """
-        # First try to get from config
-        if conf_path:
+        if parsed is not None:
+            if parsed.get('log_path'):
+                return parsed['log_path']
+            # Already parsed without a logfile setting; only defaults remain
+            conf_path = None
+
+        if conf_path not in self._found_logs:
+            log_path = self._search_log_file(conf_path)
+            if conf_path in self._conf_parse_failures:
+                # Not memoized: the config is parsed again once CONF_FAILURE_TTL passes
+                return log_path
+            self._found_logs[conf_path] = log_path
+        return self._found_logs[conf_path]
+
+    def _search_log_file(self, conf_path: Optional[str]) -> Optional[str]:
+        """Search for the log file (uncached implementation of find_log_file)"""
+        # First try to get from config, unless it failed to parse moments ago
+        failed_at = self._conf_parse_failures.get(conf_path) if conf_path else None
+        if conf_path and (failed_at is None
+                          or time.monotonic() - failed_at >= self.CONF_FAILURE_TTL):
             try:
                 config = self.parse_config(conf_path)
+            except (OSError, ValueError):
+                self._conf_parse_failures[conf_path] = time.monotonic()
+            else:
+                self._conf_parse_failures.pop(conf_path, None)
                 if config.get('log_path'):
                     return config['log_path']
-            except:
-                pass
 
         # Fall back to default locations
+        self._probe_paths(self.DEFAULT_LOG_PATHS)
         for path in self.DEFAULT_LOG_PATHS:
-            if self.executor.file_exists(path):
+            if self._is_file(path):
                 return path
 
         return None
@@ -88,62 +282,105 @@ class OdooConfigParser:
         Returns:
             Dictionary with extracted configuration
         """
-        # Read the config file
-        content = self.executor.read_file(conf_path)
+        # Reuse the last parse while the file is unchanged
+        mtime = self.executor.get_mtime(conf_path)
+        cached = self._conf_cache.get(conf_path)
+        if cached is not None and mtime is not None and cached[0] == mtime:
+            return dict(cached[1])
 
-        # Parse with configparser
-        config = configparser.ConfigParser()
-        config.read_string(content)
+        result = self._read_config(conf_path)
+        if mtime is not None:
+            self._conf_cache[conf_path] = (mtime, result)
+        return dict(result)
+
+    def _read_config(self, conf_path: str) -> Dict[str, Any]:
+        """Read and parse an odoo.conf (uncached implementation of parse_config)"""
+        options = self._scan_options(self.executor.read_file_lines(conf_path))
 
         result = {
             'odoo_conf_path': conf_path,
         }
 
         # Get the options section
-        if 'options' not in config:
+        if options is None:
             return result
 
-        options = config['options']
-
-        # Database connection
-        result['db_host'] = options.get('db_host', 'localhost')
-        result['db_port'] = int(options.get('db_port', 5432))
-        result['db_user'] = options.get('db_user', 'odoo')
-        result['db_password'] = self._clean_value(options.get('db_password', ''))
-        result['db_name'] = self._clean_value(options.get('db_name', ''))
+        # Database connection, paths and server settings
+        result.update({key: options.get(name, default) for key, name, default in self._RAW_OPTIONS})
+        result.update({key: int(options.get(name, default)) for key, name, default in self._INT_OPTIONS})
+        for key, name in self._CLEANED_OPTIONS:
+            value = options.get(name)
+            result[key] = self._clean_value(value) if value else ''
 
-        # Paths
-        result['filestore_path'] = self._clean_value(options.get('data_dir', ''))
-        result['log_path'] = self._clean_value(options.get('logfile', ''))
-        result['addons_path'] = self._clean_value(options.get('addons_path', ''))
-
-        # Server settings (useful for health checks)
+        # http_port replaced xmlrpc_port in newer Odoo versions
         result['http_port'] = int(options.get('http_port', options.get('xmlrpc_port', 8069)))
-        result['workers'] = int(options.get('workers', 0))
 
         # Try to determine Odoo version from addons path
         result['odoo_version'] = self._detect_version(result.get('addons_path', ''))
 
         return result
 
+    def _scan_options(self, lines) -> Optional[Dict[str, str]]:
+        """
+        Collect the wanted keys from the [options] section of an odoo.conf
+
+        Follows RawConfigParser's rules for what matters here: 'key = value'
+        or 'key: value', case-insensitive keys, whole-line '#'/';' comments,
+        indented continuation lines, and no '%' interpolation.
+
+        Args:
+            lines: Iterable of lines from the config file
+
+        Returns:
+            Dictionary of option name to raw value, or None if the file
+            has no [options] section
+        """
+        options = None
+        in_options = False
+        key = None
+        for line in lines:
+            stripped = line.strip()
+            if not stripped or stripped[0] in '#;':
+                key = None
+                continue
+            if key is not None and line[0] in ' \t':
+                # Continuation of the previous value
+                options[key] += '\n' + stripped
+                continue
+            key = None
+            if stripped[0] == '[' and stripped.endswith(']'):
+                in_options = stripped[1:-1] == 'options'
+                if in_options and options is None:
+                    options = {}
+                continue
+            if not in_options:
+                continue
+            eq, colon = stripped.find('='), stripped.find(':')
+            if eq < 0 or 0 <= colon < eq:
+                eq = colon
+            if eq <= 0:
+                continue
+            name = stripped[:eq].strip().lower()
+            if name in self._WANTED_OPTIONS:
+                options[name] = stripped[eq + 1:].strip()
+                key = name
+        return options
+
     def _clean_value(self, value: str) -> str:
         """Clean up a config value (handle False, None, empty)"""
-        if not value or value.lower() in ('false', 'none', ''):
+        if not value:
+            return ''
+        value = value.strip()
+        # Every placeholder is at most 5 characters, so longer values skip lower()
+        if len(value) <= 5 and value.lower() in _UNSET_VALUES:
             return ''
-        return value.strip()
+        return value
 
     def _detect_version(self, addons_path: str) -> str:
         """Try to detect Odoo version from addons path"""
-        if not addons_path:
-            return ''
-
-        # Look for version patterns in path
-        version_patterns = ['18.0', '17.0', '16.0', '15.0', '14.0', '13.0', '12.0']
-        for version in version_patterns:
-            if version in addons_path:
-                return version
-
-        return ''
+        # Single pass over the path; prefer the newest version mentioned
+        versions = _VERSION_RE.findall(addons_path or '')
+        return max(versions, key=float) if versions else ''
 
     def discover_all(self, conf_path: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -157,9 +394,12 @@ class OdooConfigParser:
         """
         result = {}
 
+        # Probe every candidate path in one round-trip; the finders below use the cache
+        self._probe_discovery_paths(conf_path)
+
         # Find or use provided conf path
         if conf_path:
-            if not self.executor.file_exists(conf_path):
+            if not self._is_file(conf_path):
                 raise FileNotFoundError(f"Config file not found: {conf_path}")
             result['odoo_conf_path'] = conf_path
         else:
@@ -168,29 +408,21 @@ class OdooConfigParser:
                 result['odoo_conf_path'] = found_conf
 
         # Parse config if found
+        parsed = {}
         if result.get('odoo_conf_path'):
             parsed = self.parse_config(result['odoo_conf_path'])
             result.update(parsed)
 
         # Find log file if not in config
         if not result.get('log_path'):
-            log_path = self.find_log_file()
+            log_path = self.find_log_file(parsed=parsed)
             if log_path:
                 result['log_path'] = log_path
 
         # Set default filestore if not found
         if not result.get('filestore_path'):
-            # Try to detect the user's home directory for proper path construction
-            stdout, stderr, code = self.executor.run_command("echo $HOME")
-            user_home = stdout.strip() if code == 0 and stdout.strip() else os.path.expanduser("~")
-
-            default_paths = [
-                '/var/lib/odoo',
-                f'{user_home}/.local/share/Odoo',
-                '/opt/odoo/.local/share/Odoo',
-            ]
-            for path in default_paths:
-                if self.executor.dir_exists(path):
+            for path in self._expand_home(self.DEFAULT_FILESTORE_PATHS):
+                if self._is_dir(path):
                     result['filestore_path'] = path
                     break
 
@@ -210,18 +442,14 @@ class OdooConfigParser:
         Returns:
             List of database names
         """
-        psql, use_local = self._find_psql()
-        env_prefix = f"PGPASSWORD='{db_password}' " if db_password else ""
-        cmd = f"{env_prefix}{psql} -h {db_host} -p {db_port} -U {db_user} -d postgres -t -c \"SELECT datname FROM pg_database WHERE datistemplate = false AND datname NOT IN ('postgres') ORDER BY datname;\""
+        query = "SELECT datname FROM pg_database WHERE datistemplate = false AND datname NOT IN ('postgres') ORDER BY datname;"
 
-        stdout, stderr, code = self._run_psql_command(cmd, use_local)
-
-        if code != 0:
+        rows, error = self._query(query, db_host, db_port, db_user, db_password)
+        if rows is None:
             return []
+        self._conn_ok[(db_host, db_port, db_user, db_password)] = time.monotonic()
 
-        # Parse output
-        databases = [db.strip() for db in stdout.strip().split('\n') if db.strip()]
-        return databases
+        return [row[0].strip() for row in rows if row and row[0].strip()]
 
     def test_database_connection(self, db_host: str = 'localhost', db_port: int = 5432,
                                   db_user: str = 'odoo', db_password: str = '') -> tuple:
@@ -231,17 +459,19 @@ class OdooConfigParser:
         Returns:
             Tuple of (success: bool, message: str)
         """
-        psql, use_local = self._find_psql()
-        env_prefix = f"PGPASSWORD='{db_password}' " if db_password else ""
-        cmd = f"{env_prefix}{psql} -h {db_host} -p {db_port} -U {db_user} -d postgres -c \"SELECT version();\" 2>&1"
-
-        stdout, stderr, code = self._run_psql_command(cmd, use_local)
-
-        if code == 0:
-            return True, f"Database connection successful{' (using local psql)' if use_local else ''}"
-        else:
-            error = stderr or stdout
-            return False, f"Connection failed: {error}"
+        # A query against the same server just succeeded; no need to ask again
+        key = (db_host, db_port, db_user, db_password)
+        checked_at = self._conn_ok.get(key)
+        if checked_at is None or time.monotonic() - checked_at >= self.CONN_CHECK_TTL:
+            rows, error = self._query("SELECT 1;", db_host, db_port, db_user, db_password)
+            if rows is None:
+                self._conn_ok.pop(key, None)
+                return False, f"Connection failed: {error}"
+            self._conn_ok[key] = time.monotonic()
+
+        # Remote checks go through psql; say so when it ran here, not on the target host
+        use_local = not isinstance(self.executor, LocalExecutor) and self._find_psql()[1]
+        return True, f"Database connection successful{' (using local psql)' if use_local else ''}"
 
     def get_odoo_service_status(self) -> tuple:
         """
@@ -259,11 +489,9 @@ class OdooConfigParser:
             return True, "Odoo service is running"
 
         # Try checking for process
-        stdout, stderr, code = self.executor.run_command(
-            "pgrep -f 'odoo.*http' > /dev/null && echo 'running' || echo 'stopped'"
-        )
+        stdout, stderr, code = self.executor.run_argv(['pgrep', '-f', 'odoo.*http'])
 
-        if 'running' in stdout:
+        if code == 0:
             return True, "Odoo process is running"
 
         return False, "Odoo is not running"
@@ -275,62 +503,129 @@ class OdooConfigParser:
         Returns:
             Dictionary with total, used, available in bytes and percentage
         """
-        stdout, stderr, code = self.executor.run_command(f"df -B1 '{path}' | tail -1")
+        return self.executor.disk_usage(path)
+
+    def _get_pg_conn(self, db_host: str, db_port: int, db_user: str,
+                     db_password: str, db_name: str = 'postgres'):
+        """
+        Get a psycopg2 connection, reusing an open one for the same target.
+
+        Only used for local executors; for SSH the database may only be
+        reachable from the remote host, so psql is run there instead.
+
+        Returns:
+            A psycopg2 connection, or None if psycopg2 is not installed or
+            the executor is remote
+        """
+        if not isinstance(self.executor, LocalExecutor):
+            return None
+        try:
+            import psycopg2
+        except ImportError:
+            return None
+
+        key = (db_host, db_port, db_user, db_password, db_name)
+        with self._pg_lock:
+            conn = self._pg_conns.get(key)
+            if conn is not None and not conn.closed:
+                return conn
+
+            conn = psycopg2.connect(
+                host=db_host, port=db_port, user=db_user,
+                password=db_password or None, dbname=db_name, connect_timeout=5,
+            )
+            # No transaction left open between calls, so stats views stay fresh
+            conn.autocommit = True
+            self._pg_conns[key] = conn
+            return conn
+
+    def close_pg_connections(self) -> None:
+        """Close any cached psycopg2 connections"""
+        with self._pg_lock:
+            for conn in self._pg_conns.values():
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._pg_conns.clear()
+
+    def _query(self, query: str, db_host: str, db_port: int, db_user: str,
+               db_password: str, db_name: str = 'postgres') -> Tuple[Optional[List[List[str]]], str]:
+        """
+        Run a query and return its rows as lists of strings.
+
+        Uses a cached psycopg2 connection when possible, otherwise falls
+        back to psql. NULLs come back as empty strings either way.
+
+        Returns:
+            Tuple of (rows, error) where rows is None if the query failed
+        """
+        try:
+            conn = self._get_pg_conn(db_host, db_port, db_user, db_password, db_name)
+        except Exception as e:
+            return None, str(e)
+
+        if conn is not None:
+            for attempt in range(2):
+                try:
+                    with conn.cursor() as cursor:
+                        cursor.execute(query)
+                        rows = cursor.fetchall() if cursor.description else []
+                    return [['' if value is None else str(value) for value in row]
+                            for row in rows], ''
+                except Exception as e:
+                    if not conn.closed or attempt:
+                        return None, str(e)
+                # The cached connection went away (e.g. server restart); reconnect once
+                try:
+                    conn = self._get_pg_conn(db_host, db_port, db_user, db_password, db_name)
+                except Exception as e:
+                    return None, str(e)
 
+        psql, use_local = self._find_psql()
+        argv = self._psql_base_argv(psql, db_host, db_port, db_user, db_name) + ['-c', query]
+        env = {'PGPASSWORD': db_password} if db_password else {}
+
+        stdout, stderr, code = self._run_psql_command(argv, env, use_local)
         if code != 0:
-            return {}
-
-        parts = stdout.split()
-        if len(parts) >= 5:
-            return {
-                'total': int(parts[1]),
-                'used': int(parts[2]),
-                'available': int(parts[3]),
-                'percent_used': parts[4].rstrip('%'),
-            }
+            return None, stderr or stdout
 
-        return {}
+        return [line.split('|') for line in stdout.strip().split('\n') if line], ''
 
     def _find_psql(self) -> tuple:
         """
         Find the psql command, checking common paths.
 
+        The result is remembered, so the probe runs once per parser.
+
         Returns:
             Tuple of (psql_path, use_local) where use_local indicates
             whether to run psql locally instead of via the executor.
         """
-        # Try common PostgreSQL paths first (most reliable)
-        common_paths = [
-            '/usr/bin/psql',
-            '/usr/local/bin/psql',
-            '/usr/pgsql-17/bin/psql',
-            '/usr/pgsql-16/bin/psql',
-            '/usr/pgsql-15/bin/psql',
-            '/usr/pgsql-14/bin/psql',
-            '/usr/lib/postgresql/17/bin/psql',
-            '/usr/lib/postgresql/16/bin/psql',
-            '/usr/lib/postgresql/15/bin/psql',
-            '/usr/lib/postgresql/14/bin/psql',
-            '/opt/postgresql/bin/psql',
-        ]
-
-        for path in common_paths:
-            stdout, stderr, code = self.executor.run_command(f"[ -x {path} ] && echo yes")
-            if code == 0 and 'yes' in stdout:
-                return (path, False)
-
-        # Try 'which psql'
-        stdout, stderr, code = self.executor.run_command("which psql 2>/dev/null")
-        if code == 0 and stdout.strip() and '/' in stdout:
-            return (stdout.strip(), False)
-
-        # Try command -v (more portable than which)
-        stdout, stderr, code = self.executor.run_command("command -v psql 2>/dev/null")
-        if code == 0 and stdout.strip() and '/' in stdout:
-            return (stdout.strip(), False)
+        with self._pg_lock:
+            if self._psql is None:
+                self._psql = self._search_psql()
+            return self._psql
+
+    def _search_psql(self) -> Tuple[str, bool]:
+        """Probe the executor, then the local machine, for psql"""
+        # List every installed psql, then 'command -v', in one round-trip.
+        # The patterns are constants and must stay unquoted so the shell globs them
+        patterns = ' '.join(self.COMMON_PSQL_PATHS)
+        stdout, stderr, code = self.executor.run_command(
+            f'for p in {patterns}; do [ -x "$p" ] && echo "$p"; done; '
+            f'command -v psql 2>/dev/null'
+        )
+        found = [line.strip() for line in stdout.split('\n') if '/' in line]
+        for pattern in self.COMMON_PSQL_PATHS:
+            matches = [path for path in found if fnmatch.fnmatchcase(path, pattern)]
+            if matches:
+                # Prefer the newest PostgreSQL version
+                return (max(matches, key=self._psql_version_key), False)
+        if found:
+            return (found[0], False)
 
         # psql not found on remote - try locally instead
-        import subprocess
         try:
             result = subprocess.run(['which', 'psql'], capture_output=True, text=True, timeout=5)
             if result.returncode == 0 and result.stdout.strip():
@@ -341,13 +636,45 @@ class OdooConfigParser:
         # Fall back to just 'psql' on remote and hope it's in PATH
         return ('psql', False)
 
-    def _run_psql_command(self, cmd: str, use_local: bool = False) -> tuple:
-        """Run a psql command either locally or via executor."""
+    @staticmethod
+    def _psql_base_argv(psql: str, db_host: str, db_port: int, db_user: str,
+                        db_name: str) -> List[str]:
+        """
+        Build the common psql argv for unaligned, tuples-only output
+
+        -X skips ~/.psqlrc, which costs startup time and can change the
+        output format; ON_ERROR_STOP makes failures show in the exit code.
+        """
+        return [
+            psql, '-X', '-v', 'ON_ERROR_STOP=1',
+            '-h', str(db_host), '-p', str(db_port), '-U', db_user, '-d', db_name,
+            '-t', '-A', '-F', '|',
+        ]
+
+    @staticmethod
+    def _psql_version_key(path: str) -> int:
+        """Sort key for psql paths: the major version they contain, else 0"""
+        match = _PSQL_PATH_VERSION_RE.search(path)
+        return int(match.group(1)) if match else 0
+
+    def _run_psql_command(self, argv: List[str], env: Dict[str, str],
+                          use_local: bool = False) -> tuple:
+        """
+        Run psql either locally or via the executor, without a local shell
+
+        Args:
+            argv: psql command and arguments
+            env: Extra environment variables, e.g. PGPASSWORD
+            use_local: Run on this machine instead of through the executor
+
+        Returns:
+            Tuple of (stdout, stderr, exit_code)
+        """
         if use_local:
-            import subprocess
             try:
                 result = subprocess.run(
-                    cmd, shell=True, capture_output=True, text=True, timeout=30
+                    argv, capture_output=True, text=True, timeout=30,
+                    env={**os.environ, **env},
                 )
                 return (result.stdout, result.stderr, result.returncode)
             except subprocess.TimeoutExpired:
@@ -355,7 +682,7 @@ class OdooConfigParser:
             except Exception as e:
                 return ("", str(e), -1)
         else:
-            return self.executor.run_command(cmd)
+            return self.executor.run_argv(argv, env=env)
 
     def get_postgresql_settings(self, db_host: str = 'localhost', db_port: int = 5432,
                                  db_user: str = 'odoo', db_password: str = '',
@@ -366,8 +693,6 @@ class OdooConfigParser:
         Returns:
             Dictionary with setting names, values, and units
         """
-        psql, use_local = self._find_psql()
-
         settings_query = """
         SELECT name, setting, unit, boot_val, context
         FROM pg_settings
@@ -381,13 +706,9 @@ class OdooConfigParser:
         ORDER BY name;
         """
 
-        env_prefix = f"PGPASSWORD='{db_password}' " if db_password else ""
-        cmd = f"{env_prefix}{psql} -h {db_host} -p {db_port} -U {db_user} -d {db_name} -t -A -F '|' -c \"{settings_query}\""
+        rows, error_msg = self._query(settings_query, db_host, db_port, db_user, db_password, db_name)
 
-        stdout, stderr, code = self._run_psql_command(cmd, use_local)
-
-        if code != 0:
-            error_msg = stderr or stdout
+        if rows is None:
             if 'command not found' in error_msg or 'not found' in error_msg:
                 return {'error': "psql not found. Install postgresql-client on either:\n"
                                  "  - The Odoo server (SSH target), or\n"
@@ -395,19 +716,17 @@ class OdooConfigParser:
             return {'error': error_msg}
 
         settings = {}
-        for line in stdout.strip().split('\n'):
-            if '|' in line:
-                parts = line.split('|')
-                if len(parts) >= 3:
-                    name = parts[0]
-                    value = parts[1]
-                    unit = parts[2] if parts[2] else ''
-                    settings[name] = {
-                        'value': value,
-                        'unit': unit,
-                        'boot_val': parts[3] if len(parts) > 3 else '',
-                        'context': parts[4] if len(parts) > 4 else '',
-                    }
+        for parts in rows:
+            if len(parts) >= 3:
+                name = parts[0]
+                value = parts[1]
+                unit = parts[2] if parts[2] else ''
+                settings[name] = {
+                    'value': value,
+                    'unit': unit,
+                    'boot_val': parts[3] if len(parts) > 3 else '',
+                    'context': parts[4] if len(parts) > 4 else '',
+                }
 
         return settings
 
@@ -420,21 +739,17 @@ class OdooConfigParser:
         Returns:
             Total memory in bytes, or None if unable to determine
         """
-        # Try to get from PostgreSQL (works on Linux)
-        query = "SELECT pg_size_pretty(setting::bigint * 1024) FROM pg_settings WHERE name = 'shared_buffers';"
+        # Read /proc/meminfo on the host and pick out MemTotal here rather
+        # than in a grep | awk pipeline
+        stdout, stderr, code = self.executor.run_argv(['cat', '/proc/meminfo'])
 
-        # First try to read /proc/meminfo via psql shell command
-        env_prefix = f"PGPASSWORD='{db_password}' " if db_password else ""
-        cmd = f"{env_prefix}psql -h {db_host} -p {db_port} -U {db_user} -d {db_name} -t -c \"COPY (SELECT 1) TO PROGRAM 'cat /proc/meminfo | grep MemTotal'\" 2>/dev/null || echo ''"
-
-        # Simpler approach - just run on the host
-        stdout, stderr, code = self.executor.run_command("grep MemTotal /proc/meminfo 2>/dev/null | awk '{print $2}'")
-
-        if code == 0 and stdout.strip():
-            try:
-                return int(stdout.strip()) * 1024  # Convert KB to bytes
-            except ValueError:
-                pass
+        if code == 0:
+            for line in stdout.splitlines():
+                if line.startswith('MemTotal:'):
+                    try:
+                        return int(line.split()[1]) * 1024  # Convert KB to bytes
+                    except (IndexError, ValueError):
+                        break
 
         return None
 
@@ -447,96 +762,137 @@ class OdooConfigParser:
         Returns:
             Dictionary with database stats including size, connections, cache hit ratio
         """
-        psql, use_local = self._find_psql()
+
+        # One round-trip for all stats: every row is tagged with its kind in
+        # the first column and padded to the same width so they can be unioned
         stats_query = """
-        SELECT
-            pg_database_size(current_database()) as db_size,
-            (SELECT count(*) FROM pg_stat_activity WHERE datname = current_database()) as active_connections,
-            (SELECT count(*) FROM pg_stat_activity) as total_connections,
-            (SELECT setting::int FROM pg_settings WHERE name = 'max_connections') as max_connections;
+        SELECT 'main',
+            pg_database_size(current_database())::text,
+            (SELECT count(*) FROM pg_stat_activity WHERE datname = current_database())::text,
+            (SELECT count(*) FROM pg_stat_activity)::text,
+            (SELECT setting FROM pg_settings WHERE name = 'max_connections'),
+            NULL
+        UNION ALL
+        SELECT 'cache',
+            (SELECT CASE WHEN (blks_hit + blks_read) > 0
+                THEN round(100.0 * blks_hit / (blks_hit + blks_read), 2)
+                ELSE 0
+             END
+             FROM pg_stat_database
+             WHERE datname = current_database())::text,
+            NULL, NULL, NULL, NULL
+        UNION ALL
+        SELECT 'bloat',
+            (SELECT count(*) FROM pg_stat_user_tables WHERE n_dead_tup > 10000)::text,
+            NULL, NULL, NULL, NULL
+        UNION ALL
+        (SELECT 'vacuum', relname::text, last_vacuum::text, last_autovacuum::text,
+                last_analyze::text, last_autoanalyze::text
+         FROM pg_stat_user_tables
+         ORDER BY n_dead_tup DESC
+         LIMIT 5);
         """
 
-        env_prefix = f"PGPASSWORD='{db_password}' " if db_password else ""
         db_to_query = db_name if db_name and db_name != 'postgres' else 'postgres'
-        cmd = f"{env_prefix}{psql} -h {db_host} -p {db_port} -U {db_user} -d {db_to_query} -t -A -F '|' -c \"{stats_query}\""
-
-        stdout, stderr, code = self._run_psql_command(cmd, use_local)
+        rows, error = self._query(stats_query, db_host, db_port, db_user, db_password, db_to_query)
 
         stats = {}
-        if code == 0 and stdout.strip():
-            parts = stdout.strip().split('|')
-            if len(parts) >= 4:
-                stats['db_size'] = int(parts[0]) if parts[0] else 0
-                stats['active_connections'] = int(parts[1]) if parts[1] else 0
-                stats['total_connections'] = int(parts[2]) if parts[2] else 0
-                stats['max_connections'] = int(parts[3]) if parts[3] else 0
-
-        # Get cache hit ratio
-        cache_query = """
-        SELECT
-            CASE WHEN (blks_hit + blks_read) > 0
-                THEN round(100.0 * blks_hit / (blks_hit + blks_read), 2)
-                ELSE 0
-            END as cache_hit_ratio
-        FROM pg_stat_database
-        WHERE datname = current_database();
-        """
-        cmd = f"{env_prefix}{psql} -h {db_host} -p {db_port} -U {db_user} -d {db_to_query} -t -c \"{cache_query}\""
-        stdout, stderr, code = self._run_psql_command(cmd, use_local)
-        if code == 0 and stdout.strip():
-            try:
-                stats['cache_hit_ratio'] = float(stdout.strip())
-            except ValueError:
-                stats['cache_hit_ratio'] = 0
-
-        # Get table bloat info (simplified - count of tables needing vacuum)
-        bloat_query = """
-        SELECT count(*)
-        FROM pg_stat_user_tables
-        WHERE n_dead_tup > 10000;
-        """
-        cmd = f"{env_prefix}{psql} -h {db_host} -p {db_port} -U {db_user} -d {db_to_query} -t -c \"{bloat_query}\""
-        stdout, stderr, code = self._run_psql_command(cmd, use_local)
-        if code == 0 and stdout.strip():
-            try:
-                stats['tables_needing_vacuum'] = int(stdout.strip())
-            except ValueError:
-                stats['tables_needing_vacuum'] = 0
-
-        # Get last vacuum times for critical tables
-        vacuum_query = """
-        SELECT relname, last_vacuum, last_autovacuum, last_analyze, last_autoanalyze
-        FROM pg_stat_user_tables
-        ORDER BY n_dead_tup DESC
-        LIMIT 5;
-        """
-        cmd = f"{env_prefix}{psql} -h {db_host} -p {db_port} -U {db_user} -d {db_to_query} -t -A -F '|' -c \"{vacuum_query}\""
-        stdout, stderr, code = self._run_psql_command(cmd, use_local)
-        if code == 0 and stdout.strip():
-            tables = []
-            for line in stdout.strip().split('\n'):
-                if '|' in line:
-                    parts = line.split('|')
-                    if len(parts) >= 5:
-                        tables.append({
-                            'name': parts[0],
-                            'last_vacuum': parts[1] or 'Never',
-                            'last_autovacuum': parts[2] or 'Never',
-                            'last_analyze': parts[3] or 'Never',
-                            'last_autoanalyze': parts[4] or 'Never',
-                        })
+        if not rows:
+            return stats
+
+        tables = []
+        for parts in rows:
+            if len(parts) < 6:
+                continue
+            kind = parts[0]
+            if kind == 'main':
+                stats['db_size'] = int(parts[1]) if parts[1] else 0
+                stats['active_connections'] = int(parts[2]) if parts[2] else 0
+                stats['total_connections'] = int(parts[3]) if parts[3] else 0
+                stats['max_connections'] = int(parts[4]) if parts[4] else 0
+            elif kind == 'cache':
+                try:
+                    stats['cache_hit_ratio'] = float(parts[1])
+                except ValueError:
+                    stats['cache_hit_ratio'] = 0
+            elif kind == 'bloat':
+                try:
+                    stats['tables_needing_vacuum'] = int(parts[1])
+                except ValueError:
+                    stats['tables_needing_vacuum'] = 0
+            elif kind == 'vacuum':
+                tables.append({
+                    'name': parts[1],
+                    'last_vacuum': parts[2] or 'Never',
+                    'last_autovacuum': parts[3] or 'Never',
+                    'last_analyze': parts[4] or 'Never',
+                    'last_autoanalyze': parts[5] or 'Never',
+                })
+        if tables:
             stats['top_tables'] = tables
 
         return stats
 
+    def get_database_overview(self, db_host: str = 'localhost', db_port: int = 5432,
+                              db_user: str = 'odoo', db_password: str = '',
+                              db_name: str = 'postgres') -> Dict[str, Any]:
+        """
+        Fetch version, settings, stats and server memory concurrently
+
+        The four lookups are independent and each is a psql process or
+        SSH round-trip, so they run in parallel threads.
+
+        Returns:
+            Dictionary with 'version', 'settings', 'stats' and 'server_ram'
+        """
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {
+                'version': pool.submit(self.get_postgresql_version,
+                                       db_host, db_port, db_user, db_password),
+                'settings': pool.submit(self.get_postgresql_settings,
+                                        db_host, db_port, db_user, db_password, db_name),
+                'stats': pool.submit(self.get_database_stats,
+                                     db_host, db_port, db_user, db_password, db_name),
+                'server_ram': pool.submit(self.get_server_memory),
+            }
+        return {name: future.result() for name, future in futures.items()}
+
     def get_postgresql_version(self, db_host: str = 'localhost', db_port: int = 5432,
                                 db_user: str = 'odoo', db_password: str = '') -> str:
         """Get PostgreSQL version string"""
-        psql, use_local = self._find_psql()
-        env_prefix = f"PGPASSWORD='{db_password}' " if db_password else ""
-        cmd = f"{env_prefix}{psql} -h {db_host} -p {db_port} -U {db_user} -d postgres -t -c \"SELECT version();\""
-
-        stdout, stderr, code = self._run_psql_command(cmd, use_local)
-        if code == 0:
-            return stdout.strip()
+        rows, error = self._query("SELECT version();", db_host, db_port, db_user, db_password)
+        if rows:
+            return rows[0][0].strip()
         return ""
+
+
+def discover_many(configs: List[Dict[str, Any]], max_workers: int = 16) -> List[Dict[str, Any]]:
+    """
+    Run discover_all() against several hosts concurrently
+
+    Remote discovery is latency-bound, so hosts are probed in parallel
+    threads; executors for the same server share the SSH connection pool.
+
+    Args:
+        configs: Executor configs (as accepted by create_executor), each
+            optionally carrying an 'odoo_conf_path' to use instead of auto-detection
+        max_workers: Upper bound on concurrent discoveries
+
+    Returns:
+        Discovery results in the same order as configs; a failed host yields
+        {'error': message}
+    """
+    def discover_one(config: Dict[str, Any]) -> Dict[str, Any]:
+        executor = create_executor(config)
+        try:
+            return OdooConfigParser(executor).discover_all(config.get('odoo_conf_path'))
+        except Exception as e:
+            return {'error': str(e)}
+        finally:
+            executor.disconnect()
+
+    if not configs:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(configs))) as pool:
+        return list(pool.map(discover_one, configs))
@@ -7,19 +7,28 @@ import os
 import sys
 import sqlite3
 import base64
+import functools
+import hashlib
+import itertools
+import threading
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Iterator, NamedTuple, Optional, List, Dict, Any, Tuple
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
+# Prefix for AES-GCM password tokens; older Fernet tokens have none
+_TOKEN_PREFIX = 'v3:'
 
+
+@functools.lru_cache(maxsize=None)
 def _get_default_db_path() -> Path:
     """
     Get the default database path based on installation mode.
 
     - Dev mode (PYTHONPATH or editable install): ~/.config/odoobench-dev/
     - Installed mode (pip/pipx): ~/.config/odoobench/
+
+    The result (and the directory creation) is computed once per process.
     """
     # Check if we're running in dev mode
     # Dev mode indicators:
@@ -52,6 +61,129 @@ def _get_default_db_path() -> Path:
     return config_dir / 'connections.db'
 
 
+# Key material for the password ciphers: the user's uid and home directory.
+# Fixed for the life of the process, so it is built once at import.
+_MACHINE_ID = f"{os.getuid()}{os.path.expanduser('~')}".encode()
+
+
+@functools.lru_cache(maxsize=4)
+def _machine_cipher(machine_id: bytes) -> AESGCM:
+    """
+    Build the AES-GCM cipher used for new password tokens.
+
+    The machine id is not a secret an attacker has to guess (anyone who can
+    read the database can compute it), so key stretching protects nothing
+    here; a single SHA-256 over a fixed salt is enough.
+    """
+    return AESGCM(hashlib.sha256(b"odoobench-aesgcm-v3" + machine_id).digest())
+
+
+@functools.lru_cache(maxsize=4)
+def _legacy_cipher(machine_id: bytes) -> Fernet:
+    """
+    Build the Fernet cipher that older versions encrypted passwords with.
+
+    Only derived when such a token is actually read, since the 100,000-round
+    PBKDF2 dominates startup.
+    """
+    key = hashlib.pbkdf2_hmac('sha256', machine_id, b"odoo_backup_salt_v1", 100000, dklen=32)
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+# Values written for an instance when its config leaves them out; every
+# writable column is listed so the dict can be bound to :named parameters
+_INSTANCE_DEFAULTS = {
+    'host': 'localhost', 'ssh_port': 22, 'ssh_username': None, 'ssh_key_path': None,
+    'is_local': False, 'odoo_conf_path': None, 'log_path': None,
+    'filestore_path': None, 'addons_path': None,
+    'db_host': 'localhost', 'db_port': 5432, 'db_user': 'odoo', 'db_name': None,
+    'is_production': False, 'allow_restore': False, 'group_name': None, 'notes': None,
+}
+
+_INSERT_INSTANCE_SQL = """
+    INSERT INTO odoo_instances (
+        name, host, ssh_port, ssh_username, ssh_password, ssh_key_path,
+        is_local, odoo_conf_path, log_path, filestore_path, addons_path,
+        db_host, db_port, db_user, db_password, db_name,
+        is_production, allow_restore, group_name, notes
+    ) VALUES (
+        :name, :host, :ssh_port, :ssh_username, :ssh_password, :ssh_key_path,
+        :is_local, :odoo_conf_path, :log_path, :filestore_path, :addons_path,
+        :db_host, :db_port, :db_user, :db_password, :db_name,
+        :is_production, :allow_restore, :group_name, :notes
+    )
+"""
+
+_UPDATE_INSTANCE_SQL = """
+    UPDATE odoo_instances SET
+        name = :name, host = :host, ssh_port = :ssh_port, ssh_username = :ssh_username,
+        ssh_password = :ssh_password, ssh_key_path = :ssh_key_path, is_local = :is_local,
+        odoo_conf_path = :odoo_conf_path, log_path = :log_path,
+        filestore_path = :filestore_path, addons_path = :addons_path,
+        db_host = :db_host, db_port = :db_port, db_user = :db_user,
+        db_password = :db_password, db_name = :db_name,
+        is_production = :is_production, allow_restore = :allow_restore,
+        group_name = :group_name, notes = :notes,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = :id
+"""
+
+
+# Turns _INSERT_INSTANCE_SQL into an upsert that refreshes an existing instance
+# of the same name; stored passwords are kept since exports never include them
+_UPSERT_INSTANCE_SUFFIX = """
+    ON CONFLICT(name) DO UPDATE SET
+        host = excluded.host, ssh_port = excluded.ssh_port,
+        ssh_username = excluded.ssh_username, ssh_key_path = excluded.ssh_key_path,
+        is_local = excluded.is_local, odoo_conf_path = excluded.odoo_conf_path,
+        log_path = excluded.log_path, filestore_path = excluded.filestore_path,
+        addons_path = excluded.addons_path, db_host = excluded.db_host,
+        db_port = excluded.db_port, db_user = excluded.db_user,
+        db_name = excluded.db_name, is_production = excluded.is_production,
+        allow_restore = excluded.allow_restore, group_name = excluded.group_name,
+        notes = excluded.notes, updated_at = CURRENT_TIMESTAMP
+"""
+
+# Columns read by _row_to_dict, in SELECT order, so rows can be zipped
+# straight into dicts instead of looked up by name
+_INSTANCE_FIELDS = (
+    'id', 'name', 'host', 'ssh_port', 'ssh_username', 'ssh_password', 'ssh_key_path', 'is_local',
+    'odoo_conf_path', 'log_path', 'filestore_path', 'addons_path',
+    'db_host', 'db_port', 'db_user', 'db_password', 'db_name',
+    'is_production', 'allow_restore', 'group_name', 'notes', 'created_at', 'updated_at',
+)
+_INSTANCE_COLUMNS = ', '.join(_INSTANCE_FIELDS)
+# Fixed statement text so each connection's prepared-statement cache is hit
+_SELECT_INSTANCE_BY_ID_SQL = f"SELECT {_INSTANCE_COLUMNS} FROM odoo_instances WHERE id = ?"
+_SELECT_INSTANCE_BY_NAME_SQL = f"SELECT {_INSTANCE_COLUMNS} FROM odoo_instances WHERE name = ?"
+
+
+# Stored in PRAGMA user_version; bump when _init_db gains a migration step
+_SCHEMA_VERSION = 2
+
+
+class _SshConfig(NamedTuple):
+    """SSH settings of a remote instance, as cached by OdooInstanceManager"""
+    host: str
+    port: int
+    username: Optional[str]
+    password: Optional[str]
+    key_path: Optional[str]
+
+
+_SELECT_SSH_CONFIG_SQL = """
+    SELECT is_local, host, ssh_port, ssh_username, ssh_password, ssh_key_path
+    FROM odoo_instances WHERE id = ?
+"""
+
+
+# operation_logs columns for list views (everything except the bulky log_text)
+_OPERATION_LOG_SUMMARY_COLUMNS = (
+    "ol.id, ol.instance_id, ol.operation_type, ol.status, ol.backup_file, "
+    "ol.started_at, ol.completed_at"
+)
+
+
 class OdooInstanceManager:
     """
     Manage Odoo instance connections.
@@ -66,41 +198,82 @@ class OdooInstanceManager:
         if db_path is None:
             db_path = _get_default_db_path()
         self.db_path = str(db_path)
-        self.cipher_suite = self._get_cipher()
+        # One connection per thread (sqlite3 connections are not shareable),
+        # kept open so the page cache survives between calls
+        self._local = threading.local()
+        # instance id -> _SshConfig, or None for local instances; cleared on
+        # every write to odoo_instances
+        self._ssh_configs: Dict[int, Optional[_SshConfig]] = {}
+        self._aead = _machine_cipher(_MACHINE_ID)
         self._init_db()
 
-    def _get_cipher(self) -> Fernet:
-        """Create encryption cipher using machine-specific key"""
-        machine_id = str(os.getuid()) + os.path.expanduser("~")
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=b"odoo_backup_salt_v1",
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(machine_id.encode()))
-        return Fernet(key)
+    @property
+    def cipher_suite(self) -> Fernet:
+        """Fernet cipher for passwords saved by older versions (derived on first use)"""
+        return _legacy_cipher(_MACHINE_ID)
 
     def _encrypt(self, value: str) -> Optional[str]:
-        """Encrypt a string value"""
+        """Encrypt a string value with AES-GCM"""
         if not value:
             return None
-        return self.cipher_suite.encrypt(value.encode()).decode()
+        nonce = os.urandom(12)
+        token = nonce + self._aead.encrypt(nonce, value.encode(), None)
+        return _TOKEN_PREFIX + base64.urlsafe_b64encode(token).decode()
 
     def _decrypt(self, value: str) -> Optional[str]:
-        """Decrypt an encrypted string value"""
-        if not value:
+        """Decrypt an encrypted string value (AES-GCM, or Fernet from older versions)"""
+        if not value or value.isspace():
             return None
         try:
+            if value.startswith(_TOKEN_PREFIX):
+                token = base64.urlsafe_b64decode(value[len(_TOKEN_PREFIX):])
+                return self._aead.decrypt(token[:12], token[12:], None).decode()
             return self.cipher_suite.decrypt(value.encode()).decode()
         except Exception:
             return None
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a database connection with the per-connection PRAGMAs applied"""
+        # Connections are long-lived, so their prepared statements are reused
+        conn = sqlite3.connect(self.db_path, cached_statements=256)
+        if self.db_path != ':memory:':
+            # WAL (set once in _init_db) only needs a full sync at checkpoints
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")
+            conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Get this thread's open database connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def close(self) -> None:
+        """Close the calling thread's database connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            try:
+                # Let SQLite refresh planner statistics gathered this session
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+            conn.close()
+            self._local.conn = None
+
     def _init_db(self):
         """Initialize the database schema"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
 
+        # Journal mode is stored in the database file, so this sticks
+        if self.db_path != ':memory:':
+            cursor.execute("PRAGMA journal_mode=WAL")
+
         # Create unified odoo_instances table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS odoo_instances (
@@ -169,34 +342,50 @@ class OdooInstanceManager:
             )
         """)
 
-        # Create index for faster lookups
+        # Covering index: the history list (everything but log_text) is
+        # answered from the index alone, without visiting the table rows
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_operation_logs_instance
-            ON operation_logs(instance_id, started_at DESC)
+            CREATE INDEX IF NOT EXISTS idx_operation_logs_cover
+            ON operation_logs(instance_id, started_at DESC, id, operation_type,
+                              status, backup_file, completed_at)
         """)
 
+        cursor.execute("PRAGMA user_version")
+        if cursor.fetchone()[0] < _SCHEMA_VERSION:
+            # v2: the covering index above supersedes the plain lookup index
+            cursor.execute("DROP INDEX IF EXISTS idx_operation_logs_instance")
+            cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
         conn.commit()
-        conn.close()
 
     def get_setting(self, key: str, default: str = None) -> str:
         """Get a setting value"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
         cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
         result = cursor.fetchone()
-        conn.close()
         return result[0] if result else default
 
     def set_setting(self, key: str, value: str) -> None:
         """Set a setting value"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT OR REPLACE INTO settings (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)",
-            (key, value)
-        )
-        conn.commit()
-        conn.close()
+        conn = self._get_conn()
+        # The connection is reused, so commit on success and roll back on error
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO settings (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)",
+                (key, value)
+            )
+
+    def set_settings(self, settings: Dict[str, str]) -> None:
+        """Set several setting values in one transaction"""
+        if not settings:
+            return
+        conn = self._get_conn()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO settings (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)",
+                list(settings.items())
+            )
 
     def save_instance(self, name: str, config: Dict[str, Any]) -> int:
         """
@@ -209,47 +398,27 @@ class OdooInstanceManager:
         Returns:
             The ID of the saved instance
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
 
-        # Encrypt passwords
-        ssh_password = self._encrypt(config.get('ssh_password'))
-        db_password = self._encrypt(config.get('db_password'))
-
         try:
-            cursor.execute("""
-                INSERT INTO odoo_instances (
-                    name, host, ssh_port, ssh_username, ssh_password, ssh_key_path,
-                    is_local, odoo_conf_path, log_path, filestore_path, addons_path,
-                    db_host, db_port, db_user, db_password, db_name,
-                    is_production, allow_restore, group_name, notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                name,
-                config.get('host', 'localhost'),
-                config.get('ssh_port', 22),
-                config.get('ssh_username'),
-                ssh_password,
-                config.get('ssh_key_path'),
-                config.get('is_local', False),
-                config.get('odoo_conf_path'),
-                config.get('log_path'),
-                config.get('filestore_path'),
-                config.get('addons_path'),
-                config.get('db_host', 'localhost'),
-                config.get('db_port', 5432),
-                config.get('db_user', 'odoo'),
-                db_password,
-                config.get('db_name'),
-                config.get('is_production', False),
-                config.get('allow_restore', False),
-                config.get('group_name'),
-                config.get('notes'),
-            ))
+            cursor.execute(_INSERT_INSTANCE_SQL, self._instance_params(name, config))
             conn.commit()
+            self._ssh_configs.clear()
             return cursor.lastrowid
-        finally:
-            conn.close()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _instance_params(self, name: str, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the :named column values for an instance row, encrypting passwords"""
+        return {
+            **_INSTANCE_DEFAULTS,
+            **config,
+            'name': name,
+            'ssh_password': self._encrypt(config.get('ssh_password')),
+            'db_password': self._encrypt(config.get('db_password')),
+        }
 
     def update_instance(self, instance_id: int, name: str, config: Dict[str, Any]) -> bool:
         """
@@ -263,51 +432,19 @@ class OdooInstanceManager:
         Returns:
             True if successful
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
 
-        # Encrypt passwords
-        ssh_password = self._encrypt(config.get('ssh_password'))
-        db_password = self._encrypt(config.get('db_password'))
-
         try:
-            cursor.execute("""
-                UPDATE odoo_instances SET
-                    name = ?, host = ?, ssh_port = ?, ssh_username = ?,
-                    ssh_password = ?, ssh_key_path = ?, is_local = ?,
-                    odoo_conf_path = ?, log_path = ?, filestore_path = ?,
-                    addons_path = ?, db_host = ?, db_port = ?, db_user = ?,
-                    db_password = ?, db_name = ?, is_production = ?,
-                    allow_restore = ?, group_name = ?, notes = ?,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (
-                name,
-                config.get('host', 'localhost'),
-                config.get('ssh_port', 22),
-                config.get('ssh_username'),
-                ssh_password,
-                config.get('ssh_key_path'),
-                config.get('is_local', False),
-                config.get('odoo_conf_path'),
-                config.get('log_path'),
-                config.get('filestore_path'),
-                config.get('addons_path'),
-                config.get('db_host', 'localhost'),
-                config.get('db_port', 5432),
-                config.get('db_user', 'odoo'),
-                db_password,
-                config.get('db_name'),
-                config.get('is_production', False),
-                config.get('allow_restore', False),
-                config.get('group_name'),
-                config.get('notes'),
-                instance_id,
-            ))
+            params = self._instance_params(name, config)
+            params['id'] = instance_id
+            cursor.execute(_UPDATE_INSTANCE_SQL, params)
             conn.commit()
+            self._ssh_configs.clear()
             return cursor.rowcount > 0
-        finally:
-            conn.close()
+        except Exception:
+            conn.rollback()
+            raise
 
     def get_instance(self, instance_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -316,13 +453,12 @@ class OdooInstanceManager:
         Returns:
             Dictionary with instance configuration, or None if not found
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._get_conn()
         cursor = conn.cursor()
+        cursor.row_factory = None
 
-        cursor.execute("SELECT * FROM odoo_instances WHERE id = ?", (instance_id,))
+        cursor.execute(_SELECT_INSTANCE_BY_ID_SQL, (instance_id,))
         row = cursor.fetchone()
-        conn.close()
 
         if row is None:
             return None
@@ -336,55 +472,27 @@ class OdooInstanceManager:
         Returns:
             Dictionary with instance configuration, or None if not found
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._get_conn()
         cursor = conn.cursor()
+        cursor.row_factory = None
 
-        cursor.execute("SELECT * FROM odoo_instances WHERE name = ?", (name,))
+        cursor.execute(_SELECT_INSTANCE_BY_NAME_SQL, (name,))
         row = cursor.fetchone()
-        conn.close()
 
         if row is None:
             return None
 
         return self._row_to_dict(row)
 
-    def _row_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
-        """Convert a database row to a dictionary with decrypted passwords"""
-        return {
-            'id': row['id'],
-            'name': row['name'],
-
-            # SSH details
-            'host': row['host'],
-            'ssh_port': row['ssh_port'],
-            'ssh_username': row['ssh_username'],
-            'ssh_password': self._decrypt(row['ssh_password']),
-            'ssh_key_path': row['ssh_key_path'],
-            'is_local': bool(row['is_local']),
-
-            # Odoo paths
-            'odoo_conf_path': row['odoo_conf_path'],
-            'log_path': row['log_path'],
-            'filestore_path': row['filestore_path'],
-            'addons_path': row['addons_path'],
-
-            # Database
-            'db_host': row['db_host'],
-            'db_port': row['db_port'],
-            'db_user': row['db_user'],
-            'db_password': self._decrypt(row['db_password']),
-            'db_name': row['db_name'],
-
-            # Metadata
-            'is_production': bool(row['is_production']),
-            'allow_restore': bool(row['allow_restore']),
-            'group_name': row['group_name'],
-            'notes': row['notes'],
-
-            'created_at': row['created_at'],
-            'updated_at': row['updated_at'],
-        }
+    def _row_to_dict(self, row: Tuple) -> Dict[str, Any]:
+        """Convert a plain _INSTANCE_FIELDS row to a dictionary with decrypted passwords"""
+        data = dict(zip(_INSTANCE_FIELDS, row))
+        data['is_local'] = bool(data['is_local'])
+        data['is_production'] = bool(data['is_production'])
+        data['allow_restore'] = bool(data['allow_restore'])
+        data['ssh_password'] = self._decrypt(data['ssh_password'])
+        data['db_password'] = self._decrypt(data['db_password'])
+        return data
 
     def list_instances(self) -> List[Dict[str, Any]]:
         """
@@ -393,48 +501,51 @@ class OdooInstanceManager:
         Returns:
             List of instance summaries
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        return list(self._iter_instance_summaries())
+
+    def _iter_instance_summaries(self) -> Iterator[Dict[str, Any]]:
+        """Yield instance summaries ordered by displayed group name, then name"""
+        conn = self._get_conn()
         cursor = conn.cursor()
+        # Plain tuples: unpacking is cheaper than name lookups on sqlite3.Row
+        cursor.row_factory = None
 
         cursor.execute("""
             SELECT id, name, host, is_local, db_name, is_production,
                    allow_restore, group_name
             FROM odoo_instances
-            ORDER BY group_name, name
+            ORDER BY COALESCE(NULLIF(group_name, ''), 'Ungrouped'), name
         """)
-        rows = cursor.fetchall()
-        conn.close()
 
-        return [
-            {
-                'id': row['id'],
-                'name': row['name'],
-                'host': row['host'],
-                'is_local': bool(row['is_local']),
-                'db_name': row['db_name'],
-                'is_production': bool(row['is_production']),
-                'allow_restore': bool(row['allow_restore']),
-                'group_name': row['group_name'],
+        for id_, name, host, is_local, db_name, is_production, allow_restore, group_name in cursor:
+            yield {
+                'id': id_,
+                'name': name,
+                'host': host,
+                'is_local': bool(is_local),
+                'db_name': db_name,
+                'is_production': bool(is_production),
+                'allow_restore': bool(allow_restore),
+                'group_name': group_name,
             }
-            for row in rows
-        ]
 
     def list_instances_by_group(self) -> Dict[str, List[Dict[str, Any]]]:
         """
         List all instances organized by group.
 
         Returns:
-            Dictionary with group names as keys and lists of instances as values
+            Dictionary with group names as keys and lists of instances as
+            values, both in display order (sorted by group, then name)
         """
-        instances = self.list_instances()
         groups: Dict[str, List[Dict[str, Any]]] = {}
 
-        for instance in instances:
-            group = instance.get('group_name') or 'Ungrouped'
-            if group not in groups:
-                groups[group] = []
-            groups[group].append(instance)
+        # Rows arrive sorted by group, so each group is one contiguous run
+        for group, instances in itertools.groupby(
+            self._iter_instance_summaries(),
+            key=lambda instance: instance['group_name'] or 'Ungrouped',
+        ):
+            # setdefault: a group literally named 'Ungrouped' joins the unnamed ones
+            groups.setdefault(group, []).extend(instances)
 
         return groups
 
@@ -445,19 +556,42 @@ class OdooInstanceManager:
         Returns:
             True if successful
         """
-        conn = sqlite3.connect(self.db_path)
+        return self.delete_instances([instance_id]) > 0
+
+    def delete_instances(self, instance_ids: List[int]) -> int:
+        """
+        Delete several Odoo instances in a single transaction.
+
+        Args:
+            instance_ids: IDs of the instances to delete
+
+        Returns:
+            Number of instances actually deleted
+        """
+        ids = list(instance_ids)
+        if not ids:
+            return 0
+
+        conn = self._get_conn()
         cursor = conn.cursor()
+        deleted = 0
 
-        cursor.execute("DELETE FROM odoo_instances WHERE id = ?", (instance_id,))
-        conn.commit()
-        affected = cursor.rowcount > 0
-        conn.close()
+        with conn:
+            # Stay well under SQLite's host-parameter limit on older builds.
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(
+                    f"DELETE FROM odoo_instances WHERE id IN ({placeholders})",
+                    chunk)
+                deleted += cursor.rowcount
 
-        return affected
+        self._ssh_configs.clear()
+        return deleted
 
     def get_groups(self) -> List[str]:
         """Get list of all group names"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -466,10 +600,35 @@ class OdooInstanceManager:
             ORDER BY group_name
         """)
         groups = [row[0] for row in cursor.fetchall()]
-        conn.close()
 
         return groups
 
+    def _get_ssh_config(self, instance_id: int) -> Tuple[bool, Optional[_SshConfig]]:
+        """
+        Look up the SSH settings of an instance, cached until the next write.
+
+        Only the SSH columns are read, so the database password is never
+        decrypted for these lookups.
+
+        Returns:
+            (found, config) where config is None for local instances
+        """
+        if instance_id in self._ssh_configs:
+            return True, self._ssh_configs[instance_id]
+
+        cursor = self._get_conn().cursor()
+        cursor.row_factory = None
+        cursor.execute(_SELECT_SSH_CONFIG_SQL, (instance_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return False, None
+
+        is_local, host, port, username, password, key_path = row
+        config = None if is_local else _SshConfig(
+            host, port, username, self._decrypt(password), key_path)
+        self._ssh_configs[instance_id] = config
+        return True, config
+
     def get_executor_config(self, instance_id: int) -> Optional[Dict[str, Any]]:
         """
         Get configuration suitable for creating a ConnectionExecutor.
@@ -477,20 +636,14 @@ class OdooInstanceManager:
         Returns:
             Dictionary with executor configuration
         """
-        instance = self.get_instance(instance_id)
-        if instance is None:
+        found, config = self._get_ssh_config(instance_id)
+        if not found:
             return None
 
-        if instance['is_local']:
+        if config is None:
             return {'is_local': True}
 
-        return {
-            'host': instance['host'],
-            'port': instance['ssh_port'],
-            'username': instance['ssh_username'],
-            'password': instance['ssh_password'],
-            'key_path': instance['ssh_key_path'],
-        }
+        return config._asdict()
 
     def get_ssh_connection(self, instance_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -500,20 +653,11 @@ class OdooInstanceManager:
         Returns:
             Dictionary with SSH connection details or None
         """
-        instance = self.get_instance(instance_id)
-        if instance is None:
-            return None
+        _, config = self._get_ssh_config(instance_id)
+        if config is None:
+            return None  # Unknown, or local connections don't need SSH
 
-        if instance['is_local']:
-            return None  # Local connections don't need SSH
-
-        return {
-            'host': instance['host'],
-            'port': instance['ssh_port'],
-            'username': instance['ssh_username'],
-            'password': instance['ssh_password'],
-            'key_path': instance['ssh_key_path'],
-        }
+        return config._asdict()
 
     def save_operation_log(self, instance_id: int, operation_type: str, status: str,
                            log_text: str, backup_file: str = None) -> int:
@@ -530,23 +674,24 @@ class OdooInstanceManager:
         Returns:
             The ID of the log entry
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
 
-        cursor.execute("""
-            INSERT INTO operation_logs (instance_id, operation_type, status, backup_file, log_text, completed_at)
-            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """, (instance_id, operation_type, status, backup_file, log_text))
+        with conn:
+            cursor.execute("""
+                INSERT INTO operation_logs (instance_id, operation_type, status, backup_file, log_text, completed_at)
+                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """, (instance_id, operation_type, status, backup_file, log_text))
 
-        log_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        return log_id
+        return cursor.lastrowid
 
     def get_operation_logs(self, instance_id: int = None, limit: int = 50) -> List[Dict[str, Any]]:
         """
         Get operation logs, optionally filtered by instance.
 
+        The potentially large log_text is left out; fetch it for a single
+        entry with get_operation_log().
+
         Args:
             instance_id: Filter by instance (None for all)
             limit: Maximum number of logs to return
@@ -554,13 +699,12 @@ class OdooInstanceManager:
         Returns:
             List of log entries
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._get_conn()
         cursor = conn.cursor()
 
         if instance_id:
-            cursor.execute("""
-                SELECT ol.*, oi.name as instance_name
+            cursor.execute(f"""
+                SELECT {_OPERATION_LOG_SUMMARY_COLUMNS}, oi.name as instance_name
                 FROM operation_logs ol
                 LEFT JOIN odoo_instances oi ON ol.instance_id = oi.id
                 WHERE ol.instance_id = ?
@@ -568,8 +712,8 @@ class OdooInstanceManager:
                 LIMIT ?
             """, (instance_id, limit))
         else:
-            cursor.execute("""
-                SELECT ol.*, oi.name as instance_name
+            cursor.execute(f"""
+                SELECT {_OPERATION_LOG_SUMMARY_COLUMNS}, oi.name as instance_name
                 FROM operation_logs ol
                 LEFT JOIN odoo_instances oi ON ol.instance_id = oi.id
                 ORDER BY ol.started_at DESC
@@ -577,14 +721,12 @@ class OdooInstanceManager:
             """, (limit,))
 
         rows = cursor.fetchall()
-        conn.close()
 
         return [dict(row) for row in rows]
 
     def get_operation_log(self, log_id: int) -> Optional[Dict[str, Any]]:
         """Get a single operation log by ID"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._get_conn()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -595,7 +737,6 @@ class OdooInstanceManager:
         """, (log_id,))
 
         row = cursor.fetchone()
-        conn.close()
 
         return dict(row) if row else None
 
@@ -603,9 +744,7 @@ class OdooInstanceManager:
         """Export all instances as JSON (without passwords)"""
         import json
 
-        instances = self.list_instances()
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._get_conn()
         cursor = conn.cursor()
 
         export_data = {
@@ -613,38 +752,48 @@ class OdooInstanceManager:
             'instances': []
         }
 
-        for summary in instances:
-            cursor.execute("SELECT * FROM odoo_instances WHERE id = ?", (summary['id'],))
-            row = cursor.fetchone()
-            if row:
-                export_data['instances'].append({
-                    'name': row['name'],
-                    'host': row['host'],
-                    'ssh_port': row['ssh_port'],
-                    'ssh_username': row['ssh_username'],
-                    'ssh_key_path': row['ssh_key_path'],
-                    'is_local': bool(row['is_local']),
-                    'odoo_conf_path': row['odoo_conf_path'],
-                    'log_path': row['log_path'],
-                    'filestore_path': row['filestore_path'],
-                    'addons_path': row['addons_path'],
-                    'db_host': row['db_host'],
-                    'db_port': row['db_port'],
-                    'db_user': row['db_user'],
-                    'db_name': row['db_name'],
-                    'is_production': bool(row['is_production']),
-                    'allow_restore': bool(row['allow_restore']),
-                    'group_name': row['group_name'],
-                    'notes': row['notes'],
-                })
-
-        conn.close()
+        # One query for every exported column (passwords are never exported)
+        cursor.execute("""
+            SELECT name, host, ssh_port, ssh_username, ssh_key_path, is_local,
+                   odoo_conf_path, log_path, filestore_path, addons_path,
+                   db_host, db_port, db_user, db_name,
+                   is_production, allow_restore, group_name, notes
+            FROM odoo_instances
+            ORDER BY group_name, name
+        """)
+        for row in cursor.fetchall():
+            export_data['instances'].append({
+                'name': row['name'],
+                'host': row['host'],
+                'ssh_port': row['ssh_port'],
+                'ssh_username': row['ssh_username'],
+                'ssh_key_path': row['ssh_key_path'],
+                'is_local': bool(row['is_local']),
+                'odoo_conf_path': row['odoo_conf_path'],
+                'log_path': row['log_path'],
+                'filestore_path': row['filestore_path'],
+                'addons_path': row['addons_path'],
+                'db_host': row['db_host'],
+                'db_port': row['db_port'],
+                'db_user': row['db_user'],
+                'db_name': row['db_name'],
+                'is_production': bool(row['is_production']),
+                'allow_restore': bool(row['allow_restore']),
+                'group_name': row['group_name'],
+                'notes': row['notes'],
+            })
+
         return json.dumps(export_data, indent=2)
 
-    def import_instances(self, json_data: str) -> tuple:
+    def import_instances(self, json_data: str, overwrite: bool = False) -> tuple:
         """
         Import instances from JSON.
 
+        Args:
+            json_data: JSON produced by export_instances()
+            overwrite: Update instances whose name already exists instead of
+                skipping them (their stored passwords are kept)
+
         Returns:
             Tuple of (success_count, error_count, messages)
         """
@@ -659,8 +808,21 @@ class OdooInstanceManager:
         error_count = 0
         messages = []
 
+        conn = self._get_conn()
+        cursor = conn.cursor()
+
+        # Look up every existing name once instead of letting each insert fail
+        cursor.execute("SELECT name FROM odoo_instances")
+        existing = {row[0] for row in cursor.fetchall()}
+
+        rows = []
         for instance in data.get('instances', []):
             try:
+                name = instance['name']
+                if name in existing and not overwrite:
+                    error_count += 1
+                    messages.append(f"Skipped (exists): {name}")
+                    continue
                 # Remove passwords (not exported)
                 config = {
                     'host': instance.get('host', 'localhost'),
@@ -681,14 +843,24 @@ class OdooInstanceManager:
                     'group_name': instance.get('group_name'),
                     'notes': instance.get('notes'),
                 }
-                self.save_instance(instance['name'], config)
+                rows.append(self._instance_params(name, config))
+                messages.append(f"Updated: {name}" if name in existing else f"Imported: {name}")
+                existing.add(name)
                 success_count += 1
-                messages.append(f"Imported: {instance['name']}")
-            except sqlite3.IntegrityError:
-                error_count += 1
-                messages.append(f"Skipped (exists): {instance.get('name', 'unknown')}")
             except Exception as e:
                 error_count += 1
                 messages.append(f"Error: {instance.get('name', 'unknown')}: {e}")
 
+        # Insert everything in one transaction (one commit instead of one per row)
+        sql = _INSERT_INSTANCE_SQL + _UPSERT_INSTANCE_SUFFIX if overwrite else _INSERT_INSTANCE_SQL
+        try:
+            with conn:
+                cursor.executemany(sql, rows)
+            self._ssh_configs.clear()
+        except sqlite3.Error as e:
+            error_count += success_count
+            success_count = 0
+            messages = [m for m in messages if not m.startswith(("Imported: ", "Updated: "))]
+            messages.append(f"Error: import failed, nothing was imported: {e}")
+
         return success_count, error_count, messages
@@ -1,9 +1,13 @@
 """GUI module for OdooBench"""
 
-try:
-    from .main_window import OdooBenchGUI
+__all__ = ["OdooBenchGUI", "OdooBackupRestoreGUI"]
 
-    __all__ = ["OdooBenchGUI"]
-except ImportError:
-    # GUI not available (tkinter not installed)
-    __all__ = []
+
+def __getattr__(name):
+    # Import main_window (and with it tkinter) only when the GUI class is
+    # actually requested, not whenever a submodule of this package is loaded.
+    # OdooBackupRestoreGUI is kept as an alias for the older export name.
+    if name in ("OdooBenchGUI", "OdooBackupRestoreGUI"):
+        from .main_window import OdooBenchGUI
+        return OdooBenchGUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,7 +8,12 @@ from tkinter import ttk, messagebox, filedialog
 import tkinter.font as tkfont
 import threading
 import os
+import queue
 import re
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain, islice
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 
@@ -19,9 +24,171 @@ from ..core.backup_restore import OdooBench
 from ..version import __version__
 
 
+# Log level of a log line: the first standalone level word
+_LOG_LEVEL_RE = re.compile(r'(?:^|\s)(ERROR|WARNING|INFO|DEBUG|CRITICAL)\b')
+
+
+# Start of a log entry; other lines (tracebacks etc.) continue the previous one.
+# Odoo log format: "2025-12-04 03:54:04,773 PID LEVEL ..."
+_LOG_TIMESTAMP_RE = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
+
+
+# Level field values of an Odoo log line that have a text tag
+_LOG_LEVELS = {level: level for level in ('ERROR', 'WARNING', 'INFO', 'DEBUG', 'CRITICAL')}
+
+
+def _classify_log_line(line: str) -> Optional[str]:
+    """Return the level tag for a log line, or None"""
+    # Fast path for "YYYY-MM-DD HH:MM:SS,mmm PID LEVEL ...": read the field
+    # after the PID instead of scanning the whole line with the regex. With
+    # the full timestamp checked, no earlier word can be a level name.
+    if (line[23:24] == ' ' and line[19] == ',' and line[20:23].isdigit()
+            and _LOG_TIMESTAMP_RE.match(line)):
+        pid_end = line.find(' ', 24)
+        if line[24:pid_end].isdigit():
+            level_end = line.find(' ', pid_end + 1)
+            level = _LOG_LEVELS.get(line[pid_end + 1:level_end if level_end > 0 else None])
+            if level:
+                return level
+    match = _LOG_LEVEL_RE.search(line)
+    return match.group(1) if match else None
+
+
+# Version number in the server's version() string
+_PG_VERSION_RE = re.compile(r'PostgreSQL (\d+\.\d+)')
+
+
+# PostgreSQL settings shown on the database tab:
+# (setting name, display name, recommendation key)
+_PG_SETTINGS_INFO = (
+    ('shared_buffers', 'Shared Buffers', 'shared_buffers'),
+    ('effective_cache_size', 'Effective Cache Size', 'effective_cache_size'),
+    ('work_mem', 'Work Memory', 'work_mem'),
+    ('maintenance_work_mem', 'Maintenance Work Memory', 'maintenance_work_mem'),
+    ('max_connections', 'Max Connections', 'max_connections'),
+    ('random_page_cost', 'Random Page Cost', 'random_page_cost'),
+    ('effective_io_concurrency', 'Effective I/O Concurrency', 'effective_io_concurrency'),
+    ('checkpoint_completion_target', 'Checkpoint Completion Target', 'checkpoint_completion_target'),
+    ('wal_buffers', 'WAL Buffers', 'wal_buffers'),
+)
+
+
+# How the database tab rates PostgreSQL settings:
+# setting -> (compare in MB, bands). The first band whose bounds hold the
+# value, low <= value <= high (None: unbounded), gives (status text, tag).
+_PG_SETTING_BANDS = {
+    # shared_buffers should be at least 256MB
+    'shared_buffers': (True, (
+        (256, None, 'Good', 'good'),
+        (128, None, 'Low', 'warning'),
+        (None, None, 'Too Low', 'bad'),
+    )),
+    # Should be at least 1GB
+    'effective_cache_size': (True, (
+        (1024, None, 'Good', 'good'),
+        (512, None, 'Low', 'warning'),
+        (None, None, 'Too Low', 'bad'),
+    )),
+    # 4-64MB is reasonable
+    'work_mem': (True, (
+        (4, 128, 'Good', 'good'),
+        (None, 4, 'Too Low', 'warning'),
+        (None, None, 'High', 'warning'),
+    )),
+    'maintenance_work_mem': (True, (
+        (256, None, 'Good', 'good'),
+        (64, None, 'OK', 'warning'),
+        (None, None, 'Low', 'bad'),
+    )),
+    # 1.1 for SSD, 4.0 for HDD
+    'random_page_cost': (False, (
+        (None, 1.5, 'SSD', 'good'),
+        (None, 2.0, 'OK', 'info'),
+        (None, None, 'HDD Default', 'warning'),
+    )),
+    'effective_io_concurrency': (False, (
+        (100, None, 'SSD', 'good'),
+        (2, None, 'OK', 'info'),
+        (None, None, 'Default', 'warning'),
+    )),
+    'checkpoint_completion_target': (False, (
+        (0.9, None, 'Good', 'good'),
+        (0.7, None, 'OK', 'info'),
+        (None, None, 'Low', 'warning'),
+    )),
+    'max_connections': (False, (
+        (50, 200, 'Good', 'good'),
+        (200, None, 'High', 'warning'),
+        (None, None, 'Low', 'warning'),
+    )),
+    'wal_buffers': (True, (
+        (16, None, 'Good', 'good'),
+        (None, None, 'Default', 'info'),
+    )),
+}
+
+
+# Tcl 8.6 strings are UTF-16, so characters beyond the BMP take two Text
+# index positions
+_TK_WIDE_CHARS = tk.TclVersion < 9.0
+
+
+def _tk_column(line: str, col: int) -> int:
+    """Text widget column of a str index into line"""
+    if _TK_WIDE_CHARS and not line.isascii():
+        return col + sum(1 for ch in line[:col] if ord(ch) > 0xFFFF)
+    return col
+
+
+def _unlowered_column(line: str, lowered_col: int) -> int:
+    """Map a str index into line.lower() back to line (lower() may lengthen characters)"""
+    length = 0
+    for col, ch in enumerate(line):
+        if length >= lowered_col:
+            return col
+        length += len(ch.lower())
+    return len(line)
+
+
+# Text tag options shared by every Logs tab, by log level
+_LOG_LEVEL_TAGS = (
+    ('ERROR', {'foreground': '#ff6b6b'}),
+    ('WARNING', {'foreground': '#ffa500'}),
+    ('INFO', {'foreground': '#69db7c'}),
+    ('DEBUG', {'foreground': '#868e96'}),
+    ('CRITICAL', {'foreground': '#ff6b6b', 'underline': True}),
+)
+
+# Text tag options shared by every operation log; 'info' follows the theme's
+# text colour and is configured separately
+_OPERATION_LOG_TAGS = (
+    ('error', {'foreground': '#ff6b6b'}),
+    ('warning', {'foreground': '#ffa500'}),
+    ('success', {'foreground': '#69db7c'}),
+)
+
+
+def _log_highlight_background(is_dark: bool) -> str:
+    """Background of the Logs tab 'highlight' tag for the theme"""
+    return '#5c5c00' if is_dark else '#ffd43b'
+
+
 class InstanceWindow:
     """Main window with left pane for connections and tabbed content"""
 
+    # Loaded log lines are handed to the widget this many at a time
+    LOG_BATCH_LINES = 500
+    LOG_DRAIN_INTERVAL_MS = 50
+    # Followed lines are buffered and written to the widget this often
+    LOG_FOLLOW_FLUSH_MS = 100
+    # The log Text widget only ever holds this many lines of the displayed
+    # log; scrolling past its edges swaps in the neighbouring slice
+    LOG_WINDOW_LINES = 2000
+    # Log entries filtered per event-loop tick
+    LOG_FILTER_CHUNK_ENTRIES = 5000
+    # Operation log messages are written to their widget at most this often
+    OPERATION_LOG_FLUSH_MS = 30
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title(f"OdooBench v{__version__}")
@@ -30,15 +197,24 @@ class InstanceWindow:
         # Initialize managers
         self.instance_manager = OdooInstanceManager()
 
+        # Instances grouped for the connection tree; None until (re)loaded.
+        # Reset wherever instances are added, edited, deleted or imported.
+        self._groups_cache: Optional[Dict[str, List[Dict[str, Any]]]] = None
+
         # Track open connections
         self.open_connections: Dict[int, Dict[str, Any]] = {}
         # Maps instance_id -> {'executor': executor, 'tab_id': tab_widget, 'feature_notebook': notebook}
+        # Saved connections still connecting at startup; open-tab state is
+        # not saved until they are all open
+        self._pending_restores: list = []
 
         # Load settings
         self.dark_mode_var = tk.BooleanVar(
             value=self.instance_manager.get_setting("dark_mode", "0") == "1"
         )
         self.font_size = int(self.instance_manager.get_setting("font_size", "10"))
+        # Log lines kept per Logs tab for filtering while following
+        self.log_buffer_lines = int(self.instance_manager.get_setting("log_buffer_lines", "50000"))
         self.backup_directory = self.instance_manager.get_setting(
             "backup_directory",
             os.path.expanduser("~/Documents/OdooBackups")
@@ -71,7 +247,11 @@ class InstanceWindow:
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # Bind Configure event to save geometry/layout when window is resized/moved
-        self._geometry_save_pending = False
+        self._geometry_after_id = None
+        # Window-state settings as last written, so unchanged values are skipped,
+        # and changed ones waiting to be written by the next autosave tick
+        self._saved_window_state: Dict[str, str] = {}
+        self._dirty_settings: Dict[str, str] = {}
         self.root.bind('<Configure>', self._on_configure)
 
         # Start periodic autosave (every 30 seconds)
@@ -135,6 +315,12 @@ class InstanceWindow:
         self.conn_tree = ttk.Treeview(tree_frame, selectmode='browse', show='tree')
         self.conn_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
+        # Tree items are reused across refreshes: group name / instance id ->
+        # item id, and item id -> text as last displayed
+        self._tree_item_by_group: Dict[str, str] = {}
+        self._tree_item_by_instance: Dict[int, str] = {}
+        self._tree_item_text: Dict[str, str] = {}
+
         # Scrollbar
         scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.conn_tree.yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -165,6 +351,16 @@ class InstanceWindow:
         self.connection_notebook.bind('<Button-2>', self._on_tab_middle_click)  # Middle-click
         self.connection_notebook.bind('<Button-3>', self._on_tab_right_click)   # Right-click
 
+        # Tab context menu; its commands act on the tab it was opened for
+        self._tab_menu_instance_id = None
+        self.tab_context_menu = tk.Menu(self.root, tearoff=0)
+        self.tab_context_menu.add_command(
+            label="Close Tab", command=lambda: self._close_connection(self._tab_menu_instance_id))
+        self.tab_context_menu.add_command(
+            label="Close Other Tabs", command=lambda: self._close_other_tabs(self._tab_menu_instance_id))
+        self.tab_context_menu.add_command(label="Close All Tabs", command=self._close_all_tabs)
+        self.tab_context_menu.bind('<Escape>', lambda e: self.tab_context_menu.unpost())
+
         # Welcome tab (shown when no connections are open)
         self._create_welcome_tab()
 
@@ -186,39 +382,99 @@ class InstanceWindow:
         ttk.Button(center_frame, text="New Connection", command=self._new_connection).pack(pady=10)
 
     def _refresh_connection_tree(self):
-        """Refresh the connection tree view"""
-        # Clear existing items
-        for item in self.conn_tree.get_children():
-            self.conn_tree.delete(item)
-
+        """Refresh the connection tree view, touching only items that changed"""
         # Get instances grouped
-        groups = self.instance_manager.list_instances_by_group()
+        groups = self._get_groups_cached()
+
+        group_ids = []
+        seen_instances = set()
 
         # Add groups and connections
-        for group_name, instances in sorted(groups.items()):
-            # Add group node
-            group_id = self.conn_tree.insert('', tk.END, text=f"  {group_name}",
-                                              open=True, tags=('group',))
+        for group_name, instances in groups.items():  # Already in display order
+            group_id = self._tree_item_by_group.get(group_name)
+            if group_id is None:
+                group_id = self.conn_tree.insert('', tk.END, text=f"  {group_name}",
+                                                  open=True, tags=('group',))
+                self._tree_item_by_group[group_name] = group_id
+            group_ids.append(group_id)
 
             # Add instances under group
+            item_ids = []
             for instance in instances:
-                # Determine icon/prefix based on connection state
-                prefix = "  "
-                if instance['id'] in self.open_connections:
-                    prefix = "  "  # Connected indicator would go here
-
-                # Show production warning
-                name = instance['name']
-                if instance['is_production']:
-                    name = f"{name} [PROD]"
-
-                self.conn_tree.insert(group_id, tk.END, text=f"{prefix}{name}",
-                                       values=(instance['id'],),
-                                       tags=('instance',))
+                seen_instances.add(instance['id'])
+
+                text = self._connection_item_text(instance)
+
+                item_id = self._tree_item_by_instance.get(instance['id'])
+                if item_id is None:
+                    item_id = self.conn_tree.insert(group_id, tk.END, text=text,
+                                                     values=(instance['id'],),
+                                                     tags=('instance',))
+                    self._tree_item_by_instance[instance['id']] = item_id
+                elif self._tree_item_text.get(item_id) != text:
+                    self.conn_tree.item(item_id, text=text)
+                self._tree_item_text[item_id] = text
+                item_ids.append(item_id)
+
+            # One call reorders/reattaches the group's children and detaches
+            # any that left it; skipped entirely when nothing moved
+            if self.conn_tree.get_children(group_id) != tuple(item_ids):
+                self.conn_tree.set_children(group_id, *item_ids)
+
+        # Groups that emptied are detached, not deleted, so they can be reused
+        if self.conn_tree.get_children('') != tuple(group_ids):
+            self.conn_tree.set_children('', *group_ids)
+
+        # Deleted instances never come back (ids are not reused)
+        for instance_id in list(self._tree_item_by_instance):
+            if instance_id not in seen_instances:
+                item_id = self._tree_item_by_instance.pop(instance_id)
+                self._tree_item_text.pop(item_id, None)
+                self.conn_tree.delete(item_id)
 
         # Configure tags
         self.conn_tree.tag_configure('group', font=('TkDefaultFont', 9, 'bold'))
 
+    def _connection_item_text(self, instance: Dict[str, Any]) -> str:
+        """Tree label for an instance, reflecting its connection state"""
+        # Determine icon/prefix based on connection state
+        prefix = "  "
+        if instance['id'] in self.open_connections:
+            prefix = "  "  # Connected indicator would go here
+
+        # Show production warning
+        name = instance['name']
+        if instance['is_production']:
+            name = f"{name} [PROD]"
+        return f"{prefix}{name}"
+
+    def _update_connection_indicator(self, instance_id: int,
+                                     instance: Optional[Dict[str, Any]] = None):
+        """
+        Relabel one instance's tree item after it connects or disconnects,
+        without rebuilding the tree.
+
+        Args:
+            instance_id: Instance whose item to update
+            instance: Instance dict, if it is no longer in open_connections
+        """
+        item_id = self._tree_item_by_instance.get(instance_id)
+        if item_id is None:
+            return
+
+        if instance is None:
+            instance = self.open_connections[instance_id]['instance']
+        text = self._connection_item_text(instance)
+        if self._tree_item_text.get(item_id) != text:
+            self.conn_tree.item(item_id, text=text)
+            self._tree_item_text[item_id] = text
+
+    def _get_groups_cached(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Instances grouped by group name, queried only after a change"""
+        if self._groups_cache is None:
+            self._groups_cache = self.instance_manager.list_instances_by_group()
+        return self._groups_cache
+
     def _on_connection_double_click(self, event):
         """Handle double-click on connection"""
         self._connect_selected()
@@ -272,16 +528,27 @@ class InstanceWindow:
 
     def _open_connection(self, instance: Dict[str, Any]):
         """Open a connection tab for an instance"""
-        instance_id = instance['id']
-
         # Create executor
-        exec_config = self.instance_manager.get_executor_config(instance_id)
+        exec_config = self.instance_manager.get_executor_config(instance['id'])
         try:
             executor = create_executor(exec_config)
         except Exception as e:
             messagebox.showerror("Connection Error", f"Failed to connect:\n{e}")
             return
 
+        self._finish_open_connection(instance, executor)
+
+    def _finish_open_connection(self, instance: Dict[str, Any], executor: ConnectionExecutor):
+        """Create the connection tab for an instance whose executor is ready"""
+        instance_id = instance['id']
+        if instance_id in self.open_connections:
+            # Opened by hand while this executor was connecting
+            try:
+                executor.disconnect()
+            except Exception:
+                pass
+            return
+
         # Create the connection tab
         tab_frame = ttk.Frame(self.connection_notebook)
         self.connection_notebook.add(tab_frame, text=f"  {instance['name']}  ")
@@ -297,26 +564,61 @@ class InstanceWindow:
             'tab_frame': tab_frame,
             'feature_notebook': feature_notebook,
             'tabs': {},
+            'tabs_lazy': {},  # Placeholder tab path -> creator, until first shown
         }
 
         # Create feature tabs
-        self._create_logs_tab(instance_id)
-        self._create_database_tab(instance_id)
-        self._create_backup_tab(instance_id)
+        feature_tabs = [
+            ('logs', "Logs", self._create_logs_tab),
+            ('database', "Database", self._create_database_tab),
+            ('backup', "Backup", self._create_backup_tab),
+        ]
         # Restore tab only shown if this connection allows restore (as destination)
         if instance.get('allow_restore'):
-            self._create_restore_tab(instance_id)
+            feature_tabs.append(('restore', "Restore", self._create_restore_tab))
         # Backup & Restore always available (backup FROM here, restore TO another)
-        self._create_backup_restore_tab(instance_id)
+        feature_tabs.append(('backup_restore', "Backup & Restore", self._create_backup_restore_tab))
         # Operation History tab
-        self._create_history_tab(instance_id)
+        feature_tabs.append(('history', "History", self._create_history_tab))
         # Future: modules, config, health tabs
 
+        # Only empty placeholder frames are added now; each tab's widgets are
+        # built the first time it is selected
+        lazy_tabs = self.open_connections[instance_id]['tabs_lazy']
+        for key, title, create in feature_tabs:
+            tab = self._feature_tab(instance_id, key, title)
+            lazy_tabs[str(tab)] = create
+        feature_notebook.bind('<<NotebookTabChanged>>',
+                              lambda e: self._materialize_tab(instance_id))
+        self._materialize_tab(instance_id)
+
         # Switch to the new tab
         self.connection_notebook.select(tab_frame)
 
-        # Refresh tree to show connected state
-        self._refresh_connection_tree()
+        # Show connected state
+        self._update_connection_indicator(instance_id)
+
+    def _feature_tab(self, instance_id: int, key: str, title: str) -> ttk.Frame:
+        """Return the frame of a feature tab, adding it to the notebook if needed"""
+        conn_info = self.open_connections[instance_id]
+        tab = conn_info['tabs'].get(key)
+        if tab is None:
+            feature_notebook = conn_info['feature_notebook']
+            tab = ttk.Frame(feature_notebook)
+            feature_notebook.add(tab, text=title)
+            conn_info['tabs'][key] = tab
+        return tab
+
+    def _materialize_tab(self, instance_id: int):
+        """Build the selected feature tab's widgets if it is still a placeholder"""
+        if instance_id not in self.open_connections:
+            return
+
+        conn_info = self.open_connections[instance_id]
+        current = str(conn_info['feature_notebook'].select())
+        create = conn_info['tabs_lazy'].pop(current, None)
+        if create is not None:
+            create(instance_id)
 
     def _on_tab_middle_click(self, event):
         """Handle middle-click to close tab"""
@@ -330,22 +632,8 @@ class InstanceWindow:
         if instance_id is None:
             return
 
-        # Create context menu
-        menu = tk.Menu(self.root, tearoff=0)
-        menu.add_command(label="Close Tab", command=lambda: self._close_connection(instance_id))
-        menu.add_command(label="Close Other Tabs", command=lambda: self._close_other_tabs(instance_id))
-        menu.add_command(label="Close All Tabs", command=self._close_all_tabs)
-
-        # Bind events to close menu when clicking elsewhere or pressing Escape
-        def close_menu(e=None):
-            menu.unpost()
-            menu.destroy()
-
-        menu.bind('<FocusOut>', close_menu)
-        menu.bind('<Escape>', close_menu)
-
-        # Show menu
-        menu.tk_popup(event.x_root, event.y_root, 0)
+        self._tab_menu_instance_id = instance_id
+        self.tab_context_menu.tk_popup(event.x_root, event.y_root, 0)
 
     def _get_tab_instance_id_at(self, x: int, y: int) -> Optional[int]:
         """Get the instance_id for the tab at the given coordinates"""
@@ -380,62 +668,38 @@ class InstanceWindow:
 
     def _add_text_context_menu(self, text_widget: tk.Text):
         """Add a right-click context menu with Select All, Copy, Cut, Paste to a Text widget"""
-        def show_context_menu(event):
-            menu = tk.Menu(self.root, tearoff=0)
-
-            # Check if text widget is editable
-            is_disabled = str(text_widget.cget('state')) == 'disabled'
-
-            # Select All - always available
-            def select_all():
-                text_widget.tag_add(tk.SEL, "1.0", tk.END)
-                text_widget.mark_set(tk.INSERT, "1.0")
-                text_widget.see(tk.INSERT)
-            menu.add_command(label="Select All", command=select_all, accelerator="Ctrl+A")
-
-            # Copy - always available
-            def copy_text():
-                try:
-                    text_widget.event_generate("<<Copy>>")
-                except tk.TclError:
-                    pass
-            menu.add_command(label="Copy", command=copy_text, accelerator="Ctrl+C")
-
-            # Cut - only if editable and has selection
-            def cut_text():
-                try:
-                    text_widget.event_generate("<<Cut>>")
-                except tk.TclError:
-                    pass
-            if not is_disabled:
-                menu.add_command(label="Cut", command=cut_text, accelerator="Ctrl+X")
-
-            # Paste - only if editable
-            def paste_text():
-                try:
-                    text_widget.event_generate("<<Paste>>")
-                except tk.TclError:
-                    pass
-            if not is_disabled:
-                menu.add_command(label="Paste", command=paste_text, accelerator="Ctrl+V")
+        def select_all():
+            text_widget.tag_add(tk.SEL, "1.0", tk.END)
+            text_widget.mark_set(tk.INSERT, "1.0")
+            text_widget.see(tk.INSERT)
 
-            # Close menu on focus out
-            def close_menu(e=None):
-                menu.unpost()
-                menu.destroy()
+        def generate(virtual_event):
+            try:
+                text_widget.event_generate(virtual_event)
+            except tk.TclError:
+                pass
 
-            menu.bind('<FocusOut>', close_menu)
-            menu.bind('<Escape>', close_menu)
+        # Built once per widget; Cut and Paste are enabled only while the
+        # widget is editable
+        menu = tk.Menu(text_widget, tearoff=0)
+        menu.add_command(label="Select All", command=select_all, accelerator="Ctrl+A")
+        menu.add_command(label="Copy", command=lambda: generate("<<Copy>>"), accelerator="Ctrl+C")
+        menu.add_command(label="Cut", command=lambda: generate("<<Cut>>"), accelerator="Ctrl+X")
+        menu.add_command(label="Paste", command=lambda: generate("<<Paste>>"), accelerator="Ctrl+V")
+        menu.bind('<Escape>', lambda e: menu.unpost())
 
+        def show_context_menu(event):
+            is_disabled = str(text_widget.cget('state')) == 'disabled'
+            edit_state = tk.DISABLED if is_disabled else tk.NORMAL
+            menu.entryconfigure("Cut", state=edit_state)
+            menu.entryconfigure("Paste", state=edit_state)
             menu.tk_popup(event.x_root, event.y_root, 0)
 
         text_widget.bind('<Button-3>', show_context_menu)
 
         # Also bind keyboard shortcuts
         def on_select_all(event):
-            text_widget.tag_add(tk.SEL, "1.0", tk.END)
-            text_widget.mark_set(tk.INSERT, "1.0")
-            text_widget.see(tk.INSERT)
+            select_all()
             return "break"
 
         text_widget.bind('<Control-a>', on_select_all)
@@ -484,6 +748,19 @@ class InstanceWindow:
             ):
                 return
 
+        # Stop the log tab's worker; a running tail finishes in the background
+        logs_widgets = conn_info['tabs'].get('logs_widgets', {})
+        io_pool = logs_widgets.get('io_pool')
+        if io_pool is not None:
+            io_pool.shutdown(wait=False)
+        if logs_widgets.get('shift_after_id'):
+            self.root.after_cancel(logs_widgets['shift_after_id'])
+            logs_widgets['shift_after_id'] = None
+
+        # Close the database tab's connections
+        if conn_info.get('db_parser') is not None:
+            conn_info['db_parser'].close_pg_connections()
+
         # Disconnect executor
         try:
             conn_info['executor'].disconnect()
@@ -494,21 +771,19 @@ class InstanceWindow:
         self.connection_notebook.forget(conn_info['tab_frame'])
 
         # Clean up
+        instance = conn_info['instance']
         del self.open_connections[instance_id]
 
-        # Refresh tree
-        self._refresh_connection_tree()
+        # Show disconnected state
+        self._update_connection_indicator(instance_id, instance)
 
     def _create_logs_tab(self, instance_id: int):
         """Create the Logs feature tab"""
         conn_info = self.open_connections[instance_id]
-        feature_notebook = conn_info['feature_notebook']
         instance = conn_info['instance']
         executor = conn_info['executor']
 
-        tab = ttk.Frame(feature_notebook)
-        feature_notebook.add(tab, text="Logs")
-        conn_info['tabs']['logs'] = tab
+        tab = self._feature_tab(instance_id, 'logs', "Logs")
 
         # Toolbar
         toolbar = ttk.Frame(tab)
@@ -590,22 +865,24 @@ class InstanceWindow:
         log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self._add_text_context_menu(log_text)
 
-        # Scrollbars
-        y_scroll = ttk.Scrollbar(log_frame, orient=tk.VERTICAL, command=log_text.yview)
+        # Scrollbars; the vertical one spans the whole displayed log, not just
+        # the slice currently held by the widget
+        y_scroll = ttk.Scrollbar(log_frame, orient=tk.VERTICAL,
+                                 command=lambda *args: self._on_log_scrollbar(
+                                     conn_info['tabs']['logs_widgets'], *args))
         y_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        log_text.configure(yscrollcommand=y_scroll.set)
+        log_text.configure(yscrollcommand=lambda first, last: self._on_log_yscroll(
+            conn_info['tabs']['logs_widgets'], first, last))
 
         x_scroll = ttk.Scrollbar(tab, orient=tk.HORIZONTAL, command=log_text.xview)
         x_scroll.pack(fill=tk.X, padx=5)
         log_text.configure(xscrollcommand=x_scroll.set)
 
         # Configure text tags for log levels
-        log_text.tag_configure('ERROR', foreground='#ff6b6b')
-        log_text.tag_configure('WARNING', foreground='#ffa500')
-        log_text.tag_configure('INFO', foreground='#69db7c')
-        log_text.tag_configure('DEBUG', foreground='#868e96')
-        log_text.tag_configure('CRITICAL', foreground='#ff6b6b', underline=True)
-        log_text.tag_configure('highlight', background='#ffd43b' if not is_dark else '#5c5c00')
+        for name, options in _LOG_LEVEL_TAGS:
+            log_text.tag_configure(name, **options)
+        log_text.tag_configure('highlight', background=_log_highlight_background(is_dark))
+        log_text.tag_configure('find_highlight', background='yellow', foreground='black')
 
         # Context menu for log text
         log_context_menu = tk.Menu(log_text, tearoff=0)
@@ -640,11 +917,54 @@ class InstanceWindow:
             'level_var': level_var,
             'find_entry': find_entry,
             'find_var': find_var,
-            'find_pos': '1.0',  # Current find position
+            'find_pos': (0, 0),  # Current find position: (line, column) in view_lines
+            'find_index': None,  # (lowercased joined view_lines, line offsets) for find
+            'find_match': None,  # Highlighted match: (line, start, end) in view_lines
             'log_text': log_text,
-            'all_logs': [],  # Store all log lines for filtering
+            'y_scroll': y_scroll,
+            # Store log lines for filtering, bounded so following a busy log
+            # for hours keeps a fixed window instead of growing without limit
+            'all_logs': deque(maxlen=self._log_buffer_size(lines_var)),
+            'log_entries': deque(),  # all_logs grouped into entries, for filtering
+            'entry_search_index': None,  # (lowercased joined entries, entry offsets)
+            # Lines being displayed (all_logs or a filtered list), and the
+            # slice of them currently held by log_text
+            'view_lines': [],
+            'window_start': 0,
+            'window_len': 0,
+            'shift_after_id': None,
+            'pending_lines': [],  # Followed lines waiting for the next flush
+            'flush_after_id': None,
+            'filter_after_id': None,  # Pending debounced filter pass
+            'filter_gen': 0,  # Bumped to stop a filter pass still in progress
+            'io_pool': None,  # Single worker running log tails
+            'current_future': None,  # Latest submitted tail
         }
 
+        def resize_log_buffer(*args):
+            widgets = conn_info['tabs']['logs_widgets']
+            maxlen = self._log_buffer_size(lines_var)
+            if widgets['all_logs'].maxlen != maxlen:
+                showing_all = widgets['view_lines'] is widgets['all_logs']
+                widgets['all_logs'] = deque(widgets['all_logs'], maxlen=maxlen)
+                widgets['log_entries'] = deque()
+                self._update_log_entries(widgets, widgets['all_logs'])
+                if showing_all:
+                    self._display_logs(instance_id, widgets['all_logs'])
+
+        lines_var.trace_add('write', resize_log_buffer)
+
+    def _log_buffer_size(self, lines_var: tk.StringVar) -> int:
+        """
+        Number of log lines kept for filtering: the log_buffer_lines
+        setting, or a whole load if the Lines value is larger.
+        """
+        try:
+            lines = int(lines_var.get())
+        except ValueError:
+            lines = 500
+        return max(lines, self.log_buffer_lines, 1)
+
     def _load_logs(self, instance_id: int):
         """Load logs from the server"""
         if instance_id not in self.open_connections:
@@ -656,27 +976,89 @@ class InstanceWindow:
 
         log_path = widgets['log_path_var'].get()
         lines = int(widgets['lines_var'].get())
+        buffer_size = self._log_buffer_size(widgets['lines_var'])
         log_text = widgets['log_text']
 
         if not log_path:
             messagebox.showwarning("Warning", "Please specify a log file path")
             return
 
+        # Tails run one at a time on the tab's own worker; a newer load
+        # cancels a queued one, and a superseded result is dropped on arrival
+        future = widgets.get('current_future')
+        if future is not None:
+            future.cancel()
+        if widgets.get('io_pool') is None:
+            widgets['io_pool'] = ThreadPoolExecutor(max_workers=1, thread_name_prefix='odoobench-logs')
+
         def load():
-            try:
-                content = executor.tail_file(log_path, lines)
-                log_lines = content.split('\n')
+            content = executor.tail_file(log_path, lines)
+            log_lines = content.split('\n')
+            del content
+
+            # Lines reach the widget through this queue in capped batches, so
+            # a large tail never blocks the Tk thread in a single insert
+            log_queue = queue.Queue()
+            for start in range(0, len(log_lines), self.LOG_BATCH_LINES):
+                log_queue.put(log_lines[start:start + self.LOG_BATCH_LINES])
+            log_queue.put(None)
+            return log_queue
+
+        future = widgets['io_pool'].submit(load)
+        widgets['current_future'] = future
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_tail_done, instance_id, f, buffer_size))
+
+    def _on_tail_done(self, instance_id: int, future: Future, buffer_size: int):
+        """Start showing a finished log load, unless a newer one replaced it"""
+        if instance_id not in self.open_connections:
+            return
+
+        widgets = self.open_connections[instance_id]['tabs'].get('logs_widgets', {})
+        if future is not widgets.get('current_future') or future.cancelled():
+            return
+        widgets['current_future'] = None
 
-                # Store all logs
-                widgets['all_logs'] = log_lines
+        try:
+            log_queue = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load logs:\n{e}")
+            return
 
-                # Update UI in main thread
-                self.root.after(0, lambda: self._display_logs(instance_id, log_lines))
+        widgets['log_queue'] = log_queue
+        self._drain_log_queue(instance_id, log_queue, buffer_size, True)
 
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to load logs:\n{e}"))
+    def _drain_log_queue(self, instance_id: int, log_queue: queue.Queue,
+                         buffer_size: int, first: bool = False):
+        """Move one batch of loaded log lines into the log widget per tick"""
+        if instance_id not in self.open_connections:
+            return
+
+        conn_info = self.open_connections[instance_id]
+        widgets = conn_info['tabs'].get('logs_widgets', {})
+        if widgets.get('log_queue') is not log_queue:
+            return  # Superseded by a newer load
+
+        if first:
+            widgets['all_logs'] = deque(maxlen=buffer_size)
+            widgets['log_entries'] = deque()
+            widgets['entry_search_index'] = None
+            self._display_logs(instance_id, widgets['all_logs'])
+
+        try:
+            batch = log_queue.get_nowait()
+        except queue.Empty:
+            batch = []
 
-        threading.Thread(target=load, daemon=True).start()
+        if batch:
+            # Store all logs
+            self._append_log_lines(widgets, batch)
+
+        if batch is None:
+            widgets['log_queue'] = None
+        else:
+            self.root.after(self.LOG_DRAIN_INTERVAL_MS,
+                            lambda: self._drain_log_queue(instance_id, log_queue, buffer_size))
 
     def _display_logs(self, instance_id: int, log_lines: list):
         """Display log lines in the text widget"""
@@ -687,31 +1069,255 @@ class InstanceWindow:
         widgets = conn_info['tabs'].get('logs_widgets', {})
         log_text = widgets['log_text']
 
+        widgets['view_lines'] = log_lines
+        widgets['find_index'] = None
+        widgets['find_match'] = None
+        widgets['filter_gen'] += 1  # Anything displayed supersedes a filter pass in progress
+        self._render_log_window(widgets, len(log_lines))
+        log_text.see(tk.END)
+
+    def _render_log_window(self, widgets: Dict[str, Any], start: int) -> int:
+        """
+        Fill the log widget with the LOG_WINDOW_LINES-line slice of the
+        displayed lines beginning at start (clamped to the valid range).
+
+        Returns:
+            The slice's actual start index
+        """
+        log_text = widgets['log_text']
+        view = widgets['view_lines']
+        start = max(0, min(start, len(view) - self.LOG_WINDOW_LINES))
+        lines = list(islice(view, start, start + self.LOG_WINDOW_LINES))
+
         log_text.configure(state=tk.NORMAL)
         log_text.delete('1.0', tk.END)
+        self._insert_log_lines(log_text, lines)
+        log_text.configure(state=tk.DISABLED)
 
-        for line in log_lines:
-            # Determine log level
-            tag = None
-            if ' ERROR ' in line or line.startswith('ERROR'):
-                tag = 'ERROR'
-            elif ' WARNING ' in line or line.startswith('WARNING'):
-                tag = 'WARNING'
-            elif ' INFO ' in line or line.startswith('INFO'):
-                tag = 'INFO'
-            elif ' DEBUG ' in line or line.startswith('DEBUG'):
-                tag = 'DEBUG'
-            elif ' CRITICAL ' in line:
-                tag = 'CRITICAL'
-
-            if tag:
-                log_text.insert(tk.END, line + '\n', tag)
+        widgets['window_start'] = start
+        widgets['window_len'] = len(lines)
+        # The delete above dropped the find highlight; put it back if in the slice
+        self._highlight_find_match(widgets)
+        return start
+
+    def _append_log_lines(self, widgets: Dict[str, Any], lines: list):
+        """
+        Add new lines to all_logs and, when they are being displayed, to the
+        log widget, trimming its head to stay within LOG_WINDOW_LINES.
+        """
+        all_logs = widgets['all_logs']
+        old_total = len(all_logs)
+        all_logs.extend(lines)
+        widgets['find_index'] = None
+
+        # The bounded deque may have dropped lines off its head
+        dropped = old_total + len(lines) - len(all_logs)
+        self._update_log_entries(widgets, lines, dropped)
+
+        if widgets['view_lines'] is not all_logs:
+            return  # A filtered view is shown; it picks these up when reapplied
+
+        match = widgets['find_match']
+        if match and dropped:
+            line = match[0] - dropped
+            widgets['find_match'] = (line,) + match[1:] if line >= 0 else None
+
+        start = widgets['window_start'] - dropped
+        log_text = widgets['log_text']
+
+        if widgets['window_start'] + widgets['window_len'] != old_total:
+            # Scrolled back: keep the current slice unless it fell out
+            if start < 0:
+                self._render_log_window(widgets, 0)
             else:
-                log_text.insert(tk.END, line + '\n')
+                widgets['window_start'] = start
+                self._on_log_yscroll(widgets, *log_text.yview())
+            return
 
+        if len(lines) >= self.LOG_WINDOW_LINES:
+            # The batch alone fills the slice: load its tail, rather than
+            # inserting lines only to trim them off the head again
+            self._render_log_window(widgets, len(all_logs))
+            log_text.see(tk.END)
+            return
+
+        # Otherwise append and drop the oldest lines with one delete, which
+        # leaves the surviving lines and their tags untouched
+        log_text.configure(state=tk.NORMAL)
+        self._insert_log_lines(log_text, lines)
+        window_len = widgets['window_len'] + len(lines)
+        excess = max(window_len - self.LOG_WINDOW_LINES, -start)
+        if excess > 0:
+            log_text.delete('1.0', f'{excess + 1}.0')
+            start += excess
+            window_len -= excess
         log_text.configure(state=tk.DISABLED)
         log_text.see(tk.END)
 
+        widgets['window_start'] = start
+        widgets['window_len'] = window_len
+
+    def _update_log_entries(self, widgets: Dict[str, Any], lines: list, dropped: int = 0):
+        """
+        Keep widgets['log_entries'], all_logs grouped into log entries, in
+        step with all_logs, so filtering never regroups the whole buffer.
+
+        Args:
+            widgets: Logs tab widgets
+            lines: Lines just appended to all_logs
+            dropped: Lines all_logs dropped off its head meanwhile
+        """
+        entries = widgets['log_entries']
+        widgets['entry_search_index'] = None
+
+        # An entry starts with a timestamp; other lines (tracebacks, etc.)
+        # continue the entry before them
+        is_entry_start = _LOG_TIMESTAMP_RE.match
+        for line in lines:
+            if entries and not is_entry_start(line):
+                entries[-1].append(line)
+            else:
+                entries.append([line])
+
+        # Drop the same lines from the oldest entries
+        while dropped and entries:
+            head = entries[0]
+            if len(head) <= dropped:
+                dropped -= len(head)
+                entries.popleft()
+            else:
+                del head[:dropped]
+                dropped = 0
+
+    def _on_log_yscroll(self, widgets: Dict[str, Any], first, last):
+        """
+        yscrollcommand of the log widget: report the position within the
+        whole displayed log to the scrollbar, and move the widget's slice
+        when its top or bottom edge comes into view.
+        """
+        first, last = float(first), float(last)
+        total = len(widgets['view_lines'])
+        start, window_len = widgets['window_start'], widgets['window_len']
+        if total and window_len:
+            widgets['y_scroll'].set((start + first * window_len) / total,
+                                    (start + last * window_len) / total)
+        else:
+            widgets['y_scroll'].set(first, last)
+
+        near_top = first < 0.1 and start > 0
+        near_bottom = last > 0.9 and start + window_len < total
+        if (near_top or near_bottom) and not widgets['shift_after_id']:
+            widgets['shift_after_id'] = self.root.after_idle(
+                lambda: self._shift_log_window(widgets))
+
+    def _shift_log_window(self, widgets: Dict[str, Any]):
+        """Recenter the log widget's slice on the line at the top of the view"""
+        widgets['shift_after_id'] = None
+        log_text = widgets['log_text']
+        if not log_text.winfo_exists():
+            return  # Connection closed meanwhile
+        if log_text.tag_ranges(tk.SEL):
+            return  # Reloading the slice would drop the selection before it is copied
+        top_index = log_text.index('@0,0')
+        top = widgets['window_start'] + int(top_index.split('.')[0]) - 1
+        self._show_log_line(widgets, top, recenter=True)
+
+    def _show_log_line(self, widgets: Dict[str, Any], line: int, recenter: bool = False):
+        """
+        Scroll the log widget so the given line of the displayed log is at
+        the top, loading the slice around it if needed.
+        """
+        start, window_len = widgets['window_start'], widgets['window_len']
+        if recenter or not start <= line < start + window_len:
+            start = self._render_log_window(widgets, line - self.LOG_WINDOW_LINES // 2)
+        widgets['log_text'].yview(f'{line - start + 1}.0')
+
+    def _on_log_scrollbar(self, widgets: Dict[str, Any], *args):
+        """Scrollbar command: map positions over the whole displayed log"""
+        total = len(widgets['view_lines'])
+        if args[0] != 'moveto' or total <= widgets['window_len']:
+            widgets['log_text'].yview(*args)
+            return
+
+        target = min(int(float(args[1]) * total), total - 1)
+        start, window_len = widgets['window_start'], widgets['window_len']
+        first, last = widgets['log_text'].yview()
+        visible = int((last - first) * window_len) + 1
+        if start <= target and target + visible <= start + window_len:
+            widgets['log_text'].yview('moveto', (target - start) / window_len)
+        else:
+            self._show_log_line(widgets, target)
+
+    def _insert_log_lines(self, log_text: tk.Text, log_lines: List[str]):
+        """
+        Append log lines to a text widget in a single insert call.
+
+        Consecutive lines with the same level are joined into one run, and
+        all runs go to Tk as alternating (text, tags) arguments, so the cost
+        is one Tcl round-trip instead of one per line. Each run carries one
+        tag range, the same as a tag_add per run after a plain insert would
+        give, without the extra calls.
+        """
+        # Runs are slices of log_lines, each joined into one string; only the
+        # level of each line is computed per line
+        args = []
+        run_start = 0
+        run_tag = None
+        for i, line in enumerate(log_lines):
+            tag = _classify_log_line(line)
+            if tag != run_tag and i > run_start:
+                args.extend(('\n'.join(log_lines[run_start:i]) + '\n', run_tag or ()))
+                run_start = i
+            run_tag = tag
+        if len(log_lines) > run_start:
+            args.extend(('\n'.join(log_lines[run_start:]) + '\n', run_tag or ()))
+
+        if args:
+            log_text.insert(tk.END, *args)
+
+    def _make_log_callback(self, log_text: tk.Text):
+        """
+        Build the log callback of a backup/restore operation: callable from
+        any thread with (message, level="info").
+
+        Messages are queued and written by one insert and scroll per
+        OPERATION_LOG_FLUSH_MS, instead of one of each per message.
+        """
+        pending = []
+        lock = threading.Lock()
+
+        def flush():
+            with lock:
+                messages = pending[:]
+                del pending[:]
+
+            # One (text, tag) pair per run of messages with the same level
+            args = []
+            run = []
+            run_level = None
+            for message, level in messages:
+                if level != run_level and run:
+                    args.extend((''.join(run), run_level))
+                    run = []
+                run_level = level
+                run.append(message + "\n")
+            if run:
+                args.extend((''.join(run), run_level))
+
+            log_text.configure(state=tk.NORMAL)
+            log_text.insert(tk.END, *args)
+            log_text.configure(state=tk.DISABLED)
+            log_text.see(tk.END)
+
+        def log_callback(message, level="info"):
+            with lock:
+                pending.append((message, level))
+                first = len(pending) == 1
+            if first:
+                self.root.after(self.OPERATION_LOG_FLUSH_MS, flush)
+
+        return log_callback
+
     def _toggle_log_follow(self, instance_id: int):
         """Toggle log following mode"""
         if instance_id not in self.open_connections:
@@ -725,46 +1331,40 @@ class InstanceWindow:
         log_text = widgets['log_text']
 
         if follow:
-            # Start following
+            # Start following; lines are buffered here and flushed to the
+            # widget in batches rather than one Tk update per line
+            pending = widgets['pending_lines']
+
             def on_line(line):
-                self.root.after(0, lambda l=line: self._append_log_line(instance_id, l))
+                # Append before checking, so a flush that has already reset
+                # the id either takes this line or a new flush is scheduled
+                pending.append(line)
+                if not widgets['flush_after_id']:
+                    widgets['flush_after_id'] = self.root.after(
+                        self.LOG_FOLLOW_FLUSH_MS, lambda: self._flush_log_lines(instance_id))
 
             executor.tail_file_follow(log_path, on_line)
         else:
             # Stop following
             executor.stop_tail()
 
-    def _append_log_line(self, instance_id: int, line: str):
-        """Append a single log line (for follow mode)"""
+    def _flush_log_lines(self, instance_id: int):
+        """Append the buffered followed lines (for follow mode)"""
         if instance_id not in self.open_connections:
             return
 
         conn_info = self.open_connections[instance_id]
         widgets = conn_info['tabs'].get('logs_widgets', {})
-        log_text = widgets['log_text']
 
-        # Also store in all_logs for filtering
-        if 'all_logs' in widgets:
-            widgets['all_logs'].append(line)
-
-        # Determine tag
-        tag = None
-        if ' ERROR ' in line:
-            tag = 'ERROR'
-        elif ' WARNING ' in line:
-            tag = 'WARNING'
-        elif ' INFO ' in line:
-            tag = 'INFO'
-        elif ' DEBUG ' in line:
-            tag = 'DEBUG'
+        widgets['flush_after_id'] = None
+        pending = widgets['pending_lines']
+        lines = pending[:]
+        del pending[:len(lines)]
+        if not lines:
+            return
 
-        log_text.configure(state=tk.NORMAL)
-        if tag:
-            log_text.insert(tk.END, line + '\n', tag)
-        else:
-            log_text.insert(tk.END, line + '\n')
-        log_text.configure(state=tk.DISABLED)
-        log_text.see(tk.END)
+        # Also store in all_logs for filtering
+        self._append_log_lines(widgets, lines)
 
     def _schedule_log_filter(self, instance_id: int):
         """Schedule a log filter with debounce to avoid filtering on every keystroke"""
@@ -774,12 +1374,14 @@ class InstanceWindow:
         conn_info = self.open_connections[instance_id]
         widgets = conn_info['tabs'].get('logs_widgets', {})
 
-        # Cancel any pending filter
-        if 'filter_after_id' in widgets and widgets['filter_after_id']:
+        # Cancel any pending filter, so a burst of keystrokes runs one pass,
+        # and stop one still working through a large buffer
+        if widgets.get('filter_after_id'):
             self.root.after_cancel(widgets['filter_after_id'])
+        widgets['filter_gen'] += 1
 
-        # Schedule filter after 150ms delay
-        widgets['filter_after_id'] = self.root.after(150, lambda: self._apply_log_filter(instance_id))
+        # Schedule filter 200ms after the last keystroke
+        widgets['filter_after_id'] = self.root.after(200, lambda: self._apply_log_filter(instance_id))
 
     def _apply_log_filter(self, instance_id: int):
         """Apply filter to logs"""
@@ -789,52 +1391,113 @@ class InstanceWindow:
         conn_info = self.open_connections[instance_id]
         widgets = conn_info['tabs'].get('logs_widgets', {})
 
+        # Applying now (e.g. from the level combobox) supersedes a pending pass
+        after_id = widgets.get('filter_after_id')
+        widgets['filter_after_id'] = None
+        if after_id:
+            self.root.after_cancel(after_id)
+
         filter_text = widgets['filter_var'].get().lower()
         level = widgets['level_var'].get()
-        all_logs = widgets.get('all_logs', [])
-
-        # Group lines into log entries (an entry starts with a timestamp pattern)
-        # Odoo log format: "2025-12-04 03:54:04,773 PID LEVEL ..."
-        import re
-        timestamp_pattern = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
-
-        log_entries = []
-        current_entry = []
-
-        for line in all_logs:
-            if timestamp_pattern.match(line):
-                # This is a new log entry
-                if current_entry:
-                    log_entries.append(current_entry)
-                current_entry = [line]
-            else:
-                # Continuation line (traceback, etc.)
-                current_entry.append(line)
-
-        # Don't forget the last entry
-        if current_entry:
-            log_entries.append(current_entry)
-
-        # Filter entries
-        filtered = []
-        for entry in log_entries:
-            first_line = entry[0] if entry else ''
-
-            # Level filter - check only the first line (the actual log line)
-            if level != 'ALL':
-                if level not in first_line:
-                    continue
-
-            # Text filter - check entire entry (including traceback)
-            entry_text = '\n'.join(entry).lower()
-            if filter_text and filter_text not in entry_text:
+
+        if not filter_text and level == 'ALL':
+            # Nothing to filter: show all_logs itself, which keeps following
+            self._display_logs(instance_id, widgets['all_logs'])
+            return
+
+        # Text filter - checks entire entries (including tracebacks); only
+        # the matching entries go on to the level check
+        entries = list(widgets['log_entries'])
+        if filter_text:
+            candidates = sorted(self._log_entries_matching(widgets, filter_text))
+        else:
+            candidates = range(len(entries))
+
+        # Filter entries (grouped as lines arrive, see _update_log_entries)
+        widgets['filter_gen'] += 1
+        self._filter_log_entries(instance_id, widgets, widgets['filter_gen'],
+                                 entries, candidates, 0, level, [])
+
+    def _filter_log_entries(self, instance_id: int, widgets: Dict[str, Any], gen: int,
+                            entries: list, candidates, start: int, level: str,
+                            filtered: list):
+        """
+        Filter LOG_FILTER_CHUNK_ENTRIES entries per event-loop tick, then
+        display the result. Stops as soon as a newer filter or display
+        (a bumped widgets['filter_gen']) makes the pass stale.
+
+        Args:
+            entries: Snapshot of widgets['log_entries'] being filtered
+            candidates: Ascending indexes into entries still to check: the
+                text filter's matches, or all of them
+            start: Position in candidates of this chunk
+            level: Level filter, or 'ALL'
+            filtered: Lines of the entries kept so far
+        """
+        if instance_id not in self.open_connections or widgets['filter_gen'] != gen:
+            return
+
+        # Level filter - check only the first line (the actual log line)
+        level_marker = None if level == 'ALL' else level
+
+        end = min(start + self.LOG_FILTER_CHUNK_ENTRIES, len(candidates))
+        for i in candidates[start:end]:
+            entry = entries[i]
+
+            if level_marker is not None and level_marker not in entry[0]:
                 continue
 
             # Include all lines of this entry
             filtered.extend(entry)
 
+        if end < len(candidates):
+            # Let pending keystrokes in before the next chunk
+            self.root.after(0, lambda: self._filter_log_entries(
+                instance_id, widgets, gen, entries, candidates, end, level, filtered))
+            return
+
         self._display_logs(instance_id, filtered)
 
+    def _log_entries_matching(self, widgets: Dict[str, Any], needle: str) -> set:
+        """
+        Find the log entries containing a lowercase string.
+
+        All entries are joined and lowercased into one string, cached until
+        new lines arrive, so a filter pass is a few str.find calls instead
+        of joining and lowercasing every entry again.
+
+        Returns:
+            Indexes into widgets['log_entries'] of the matching entries
+        """
+        if widgets.get('entry_search_index') is None:
+            offsets = []
+            offset = 0
+            for entry in widgets['log_entries']:
+                offsets.append(offset)
+                offset += sum(map(len, entry)) + len(entry)
+            joined = '\n'.join(chain.from_iterable(widgets['log_entries'])).lower()
+            if len(joined) != max(offset - 1, 0):
+                # Lowercasing changed some lengths (e.g. 'İ'); measure lowered lines
+                offsets = []
+                offset = 0
+                for entry in widgets['log_entries']:
+                    offsets.append(offset)
+                    offset += sum(len(line.lower()) + 1 for line in entry)
+            widgets['entry_search_index'] = (joined, offsets)
+        joined, offsets = widgets['entry_search_index']
+
+        matches = set()
+        pos = joined.find(needle)
+        while pos >= 0:
+            i = bisect_right(offsets, pos) - 1
+            entry_end = offsets[i + 1] - 1 if i + 1 < len(offsets) else len(joined)
+            if pos + len(needle) <= entry_end:
+                matches.add(i)
+                pos = joined.find(needle, entry_end + 1)  # On to the next entry
+            else:
+                pos = joined.find(needle, pos + 1)  # Spans entries: not a match
+        return matches
+
     def _clear_log_filter(self, instance_id: int):
         """Clear log filter"""
         if instance_id not in self.open_connections:
@@ -862,40 +1525,87 @@ class InstanceWindow:
 
         # Remove previous highlight
         log_text.tag_remove('find_highlight', '1.0', tk.END)
+        widgets['find_match'] = None
+
+        # Search the whole displayed log, not just the slice in the widget.
+        # The lowercased log is joined into one string (cached until the
+        # displayed lines change) so each search is a single str.find.
+        if widgets.get('find_index') is None:
+            offsets = []
+            offset = 0
+            for text in widgets['view_lines']:
+                offsets.append(offset)
+                offset += len(text) + 1
+            joined = '\n'.join(widgets['view_lines']).lower()
+            if len(joined) != max(offset - 1, 0):
+                # Lowercasing changed some lengths (e.g. 'İ'); measure lowered lines
+                offsets = []
+                offset = 0
+                for text in widgets['view_lines']:
+                    offsets.append(offset)
+                    offset += len(text.lower()) + 1
+            widgets['find_index'] = (joined, offsets)
+        joined, offsets = widgets['find_index']
+        needle = search_text.lower()
 
         # Get current position
-        current_pos = widgets.get('find_pos', '1.0')
+        line, col = widgets.get('find_pos', (0, 0))
+        offset = offsets[line] + col if line < len(offsets) else 0
 
-        # Search for text
         if forward:
-            # Start search from after current position
-            start_pos = current_pos
-            pos = log_text.search(search_text, start_pos, nocase=True, stopindex=tk.END)
-            if not pos:
-                # Wrap around to beginning
-                pos = log_text.search(search_text, '1.0', nocase=True, stopindex=start_pos)
+            # Search from after the current match, wrapping to the beginning
+            pos = joined.find(needle, offset)
+            if pos < 0:
+                pos = joined.find(needle, 0, offset + len(needle) - 1)
         else:
-            # Search backwards
-            start_pos = current_pos
-            pos = log_text.search(search_text, start_pos, nocase=True, backwards=True, stopindex='1.0')
-            if not pos:
-                # Wrap around to end
-                pos = log_text.search(search_text, tk.END, nocase=True, backwards=True, stopindex=start_pos)
-
-        if pos:
-            # Highlight the found text
-            end_pos = f"{pos}+{len(search_text)}c"
-            log_text.tag_add('find_highlight', pos, end_pos)
-            log_text.tag_config('find_highlight', background='yellow', foreground='black')
-
-            # Scroll to show the found text
-            log_text.see(pos)
+            # Search backwards from before the current match, wrapping to the end
+            pos = joined.rfind(needle, 0, offset + len(needle) - 1)
+            if pos < 0:
+                pos = joined.rfind(needle)
+
+        found = None
+        if pos >= 0:
+            i = bisect_right(offsets, pos) - 1
+            found = (i, pos - offsets[i])
+
+        if found:
+            i, pos = found
+
+            text = widgets['view_lines'][i]
+            match_start, match_end = pos, pos + len(needle)
+            if len(text.lower()) != len(text):
+                match_start = _unlowered_column(text, match_start)
+                match_end = _unlowered_column(text, match_end)
+            widgets['find_match'] = (i, match_start, match_end)
+
+            # Load the slice holding the match if needed (which highlights
+            # it), otherwise highlight it in place
+            start = widgets['window_start']
+            if not start <= i < start + widgets['window_len']:
+                self._render_log_window(widgets, i - self.LOG_WINDOW_LINES // 2)
+            else:
+                self._highlight_find_match(widgets)
+            log_text.see(f"{i - widgets['window_start'] + 1}.{_tk_column(text, match_start)}")
 
             # Update position for next search
             if forward:
-                widgets['find_pos'] = end_pos
+                widgets['find_pos'] = (i, pos + len(needle))
             else:
-                widgets['find_pos'] = pos
+                widgets['find_pos'] = (i, pos)
+
+    def _highlight_find_match(self, widgets: Dict[str, Any]):
+        """Tag the current find match, if it is in the log widget's slice"""
+        match = widgets.get('find_match')
+        if match is None:
+            return
+        i, match_start, match_end = match
+        start = widgets['window_start']
+        if not start <= i < start + widgets['window_len']:
+            return
+        text = widgets['view_lines'][i]
+        row = i - start + 1
+        widgets['log_text'].tag_add('find_highlight', f"{row}.{_tk_column(text, match_start)}",
+                                    f"{row}.{_tk_column(text, match_end)}")
 
     def _log_select_all(self, log_text: tk.Text):
         """Select all text in log widget"""
@@ -926,12 +1636,9 @@ class InstanceWindow:
     def _create_database_tab(self, instance_id: int):
         """Create the Database feature tab"""
         conn_info = self.open_connections[instance_id]
-        feature_notebook = conn_info['feature_notebook']
         instance = conn_info['instance']
 
-        tab = ttk.Frame(feature_notebook)
-        feature_notebook.add(tab, text="Database")
-        conn_info['tabs']['database'] = tab
+        tab = self._feature_tab(instance_id, 'database', "Database")
 
         # Get theme colors
         is_dark = self.dark_mode_var.get()
@@ -1063,6 +1770,18 @@ class InstanceWindow:
         # Auto-refresh on tab creation
         self.root.after(500, lambda: self._refresh_database_info(instance_id))
 
+    def _db_parser(self, conn_info: Dict[str, Any]) -> OdooConfigParser:
+        """
+        Config parser for a connection's database tab, kept while the
+        connection is open so its database connections and connection check
+        cache are reused between actions.
+        """
+        parser = conn_info.get('db_parser')
+        if parser is None:
+            parser = OdooConfigParser(conn_info['executor'])
+            conn_info['db_parser'] = parser
+        return parser
+
     def _test_db_connection(self, instance_id: int):
         """Test database connection"""
         if instance_id not in self.open_connections:
@@ -1070,12 +1789,11 @@ class InstanceWindow:
 
         conn_info = self.open_connections[instance_id]
         instance = conn_info['instance']
-        executor = conn_info['executor']
+        parser = self._db_parser(conn_info)
         widgets = conn_info['tabs'].get('database_widgets', {})
         results_text = widgets['results_text']
 
         def test():
-            parser = OdooConfigParser(executor)
             success, message = parser.test_database_connection(
                 db_host=instance.get('db_host', 'localhost'),
                 db_port=instance.get('db_port', 5432),
@@ -1093,12 +1811,11 @@ class InstanceWindow:
 
         conn_info = self.open_connections[instance_id]
         instance = conn_info['instance']
-        executor = conn_info['executor']
+        parser = self._db_parser(conn_info)
         widgets = conn_info['tabs'].get('database_widgets', {})
         results_text = widgets['results_text']
 
         def list_dbs():
-            parser = OdooConfigParser(executor)
             databases = parser.get_databases(
                 db_host=instance.get('db_host', 'localhost'),
                 db_port=instance.get('db_port', 5432),
@@ -1124,19 +1841,17 @@ class InstanceWindow:
 
         conn_info = self.open_connections[instance_id]
         instance = conn_info['instance']
-        executor = conn_info['executor']
         widgets = conn_info['tabs'].get('database_widgets', {})
 
         if not widgets:
             return
+        parser = self._db_parser(conn_info)
 
         results_text = widgets.get('results_text')
         if results_text:
             self._show_db_result(results_text, "Fetching database information...")
 
         def fetch_info():
-            parser = OdooConfigParser(executor)
-
             db_host = instance.get('db_host', 'localhost')
             db_port = instance.get('db_port', 5432)
             db_user = instance.get('db_user', 'odoo')
@@ -1144,126 +1859,173 @@ class InstanceWindow:
             db_name = instance.get('db_name', '') or 'postgres'
 
             # Fetch all data
-            version = parser.get_postgresql_version(db_host, db_port, db_user, db_password)
-            settings = parser.get_postgresql_settings(db_host, db_port, db_user, db_password, db_name)
-            stats = parser.get_database_stats(db_host, db_port, db_user, db_password, db_name)
-            server_ram = parser.get_server_memory()
+            overview = parser.get_database_overview(db_host, db_port, db_user, db_password, db_name)
+            version = overview['version']
+            settings = overview['settings']
+            stats = overview['stats']
+            server_ram = overview['server_ram']
+
+            # Format everything here, so the main thread only updates widgets
+            payload = self._build_database_display(version, settings, stats, server_ram)
 
             # Update UI on main thread
-            self.root.after(0, lambda: self._update_database_display(
-                instance_id, version, settings, stats, server_ram
-            ))
+            self.root.after(0, lambda: self._apply_database_display(instance_id, payload))
 
         threading.Thread(target=fetch_info, daemon=True).start()
 
-    def _update_database_display(self, instance_id: int, version: str, settings: dict,
-                                  stats: dict, server_ram: int):
-        """Update the database tab display with fetched data"""
-        if instance_id not in self.open_connections:
-            return
-
-        conn_info = self.open_connections[instance_id]
-        widgets = conn_info['tabs'].get('database_widgets', {})
+    def _build_database_display(self, version: str, settings: dict,
+                                stats: dict, server_ram: int) -> Dict[str, Any]:
+        """
+        Format fetched database information for the database tab. Touches
+        no widgets, so it runs on the fetching thread.
 
-        if not widgets:
-            return
+        Returns:
+            Dict of display strings and rows for _apply_database_display
+        """
+        payload: Dict[str, Any] = {}
 
-        # Update version label
-        version_label = widgets.get('version_label')
-        if version_label and version:
-            # Extract just the version number
-            match = re.search(r'PostgreSQL (\d+\.\d+)', version)
+        # Version label: just the version number
+        if version:
+            match = _PG_VERSION_RE.search(version)
             if match:
-                version_label.configure(text=f"PostgreSQL: {match.group(1)}")
+                payload['version_text'] = f"PostgreSQL: {match.group(1)}"
             else:
-                version_label.configure(text=f"PostgreSQL: {version[:30]}...")
+                payload['version_text'] = f"PostgreSQL: {version[:30]}..."
 
-        # Update health labels
-        health_labels = widgets.get('health_labels', {})
+        # Health labels: key -> (text, foreground or None)
+        health = {}
 
-        if 'db_size' in stats and health_labels.get('db_size'):
-            size_bytes = stats['db_size']
-            size_str = self._format_bytes(size_bytes)
-            health_labels['db_size'].configure(text=size_str)
+        if 'db_size' in stats:
+            health['db_size'] = (self._format_bytes(stats['db_size']), None)
 
-        if 'cache_hit_ratio' in stats and health_labels.get('cache_ratio'):
+        if 'cache_hit_ratio' in stats:
             ratio = stats['cache_hit_ratio']
             color = '#28a745' if ratio >= 99 else '#ffc107' if ratio >= 95 else '#dc3545'
-            health_labels['cache_ratio'].configure(text=f"{ratio}%", foreground=color)
+            health['cache_ratio'] = (f"{ratio}%", color)
 
-        if 'active_connections' in stats and health_labels.get('connections'):
+        if 'active_connections' in stats:
             active = stats.get('active_connections', 0)
             max_conn = stats.get('max_connections', 100)
             pct = (active / max_conn * 100) if max_conn > 0 else 0
             color = '#28a745' if pct < 50 else '#ffc107' if pct < 80 else '#dc3545'
-            health_labels['connections'].configure(text=f"{active} / {max_conn}", foreground=color)
+            health['connections'] = (f"{active} / {max_conn}", color)
 
-        if 'tables_needing_vacuum' in stats and health_labels.get('vacuum_needed'):
+        if 'tables_needing_vacuum' in stats:
             count = stats['tables_needing_vacuum']
             color = '#28a745' if count == 0 else '#ffc107' if count < 5 else '#dc3545'
-            health_labels['vacuum_needed'].configure(text=str(count), foreground=color)
+            health['vacuum_needed'] = (str(count), color)
 
-        # Update settings tree
-        settings_tree = widgets.get('settings_tree')
-        if settings_tree and not settings.get('error'):
-            # Clear existing items
-            for item in settings_tree.get_children():
-                settings_tree.delete(item)
+        payload['health'] = health
 
+        # Settings rows: (setting, values, tag); left out on error so the tree is kept
+        if not settings.get('error'):
             # Calculate recommendations based on server RAM
             recommendations = self._calculate_pg_recommendations(server_ram)
 
-            # Settings to display with their recommendations
-            settings_info = [
-                ('shared_buffers', 'Shared Buffers', 'shared_buffers'),
-                ('effective_cache_size', 'Effective Cache Size', 'effective_cache_size'),
-                ('work_mem', 'Work Memory', 'work_mem'),
-                ('maintenance_work_mem', 'Maintenance Work Memory', 'maintenance_work_mem'),
-                ('max_connections', 'Max Connections', 'max_connections'),
-                ('random_page_cost', 'Random Page Cost', 'random_page_cost'),
-                ('effective_io_concurrency', 'Effective I/O Concurrency', 'effective_io_concurrency'),
-                ('checkpoint_completion_target', 'Checkpoint Completion Target', 'checkpoint_completion_target'),
-                ('wal_buffers', 'WAL Buffers', 'wal_buffers'),
-            ]
-
-            for setting_key, display_name, rec_key in settings_info:
+            settings_rows = []
+            for setting_key, display_name, rec_key in _PG_SETTINGS_INFO:
                 if setting_key in settings:
                     setting = settings[setting_key]
-                    current = self._format_pg_setting(setting['value'], setting['unit'])
+                    # Parsed once for both formatting and evaluation
+                    try:
+                        number = float(setting['value'])
+                    except (ValueError, TypeError):
+                        number = None
+                    current = self._format_pg_setting(setting['value'], setting['unit'], number)
                     recommended = recommendations.get(rec_key, 'N/A')
-                    status, tag = self._evaluate_pg_setting(setting_key, setting, recommendations)
-
-                    settings_tree.insert('', tk.END, values=(display_name, current, recommended, status), tags=(tag,))
+                    status, tag = self._evaluate_pg_setting(setting_key, setting, recommendations, number)
+                    settings_rows.append((setting_key, (display_name, current, recommended, status), tag))
+            payload['settings_rows'] = settings_rows
 
-        # Update memory label
-        memory_label = widgets.get('memory_label')
-        if memory_label and server_ram:
+        # Memory label
+        if server_ram:
             ram_str = self._format_bytes(server_ram)
-            memory_label.configure(text=f"Server RAM: {ram_str} (recommendations based on detected RAM)")
-        elif memory_label:
-            memory_label.configure(text="Server RAM: Unknown (using conservative recommendations)")
-
-        # Update tables tree
-        tables_tree = widgets.get('tables_tree')
-        if tables_tree and 'top_tables' in stats:
-            for item in tables_tree.get_children():
-                tables_tree.delete(item)
+            payload['memory_text'] = f"Server RAM: {ram_str} (recommendations based on detected RAM)"
+        else:
+            payload['memory_text'] = "Server RAM: Unknown (using conservative recommendations)"
 
-            for table in stats['top_tables']:
-                tables_tree.insert('', tk.END, values=(
+        # Tables rows
+        if 'top_tables' in stats:
+            payload['table_rows'] = [
+                (
                     table['name'],
                     self._format_timestamp(table['last_vacuum']),
                     self._format_timestamp(table['last_autovacuum']),
                     self._format_timestamp(table['last_analyze']),
-                ))
+                )
+                for table in stats['top_tables']
+            ]
+
+        # Results text
+        if settings.get('error'):
+            payload['result_message'] = f"Error fetching settings: {settings['error']}"
+        else:
+            payload['result_message'] = "Database information refreshed successfully."
+
+        return payload
+
+    def _apply_database_display(self, instance_id: int, payload: Dict[str, Any]):
+        """Update the database tab widgets from _build_database_display output"""
+        if instance_id not in self.open_connections:
+            return
+
+        conn_info = self.open_connections[instance_id]
+        widgets = conn_info['tabs'].get('database_widgets', {})
+
+        if not widgets:
+            return
+
+        # Update version label
+        version_label = widgets.get('version_label')
+        if version_label and 'version_text' in payload:
+            version_label.configure(text=payload['version_text'])
+
+        # Update health labels
+        health_labels = widgets.get('health_labels', {})
+        for key, (text, color) in payload['health'].items():
+            label = health_labels.get(key)
+            if label:
+                if color:
+                    label.configure(text=text, foreground=color)
+                else:
+                    label.configure(text=text)
+
+        # Update settings tree
+        settings_tree = widgets.get('settings_tree')
+        if settings_tree and 'settings_rows' in payload:
+            # One item per setting (its name is the iid), updated in place;
+            # settings missing from this result are detached
+            shown = []
+            for setting_key, values, tag in payload['settings_rows']:
+                if settings_tree.exists(setting_key):
+                    settings_tree.item(setting_key, values=values, tags=(tag,))
+                else:
+                    settings_tree.insert('', tk.END, iid=setting_key, values=values, tags=(tag,))
+                shown.append(setting_key)
+            settings_tree.set_children('', *shown)
+
+        # Update memory label
+        memory_label = widgets.get('memory_label')
+        if memory_label:
+            memory_label.configure(text=payload['memory_text'])
+
+        # Update tables tree
+        tables_tree = widgets.get('tables_tree')
+        if tables_tree and 'table_rows' in payload:
+            # Reuse the existing rows, adding or deleting only the difference
+            items = tables_tree.get_children()
+            table_rows = payload['table_rows']
+            for item, values in zip(items, table_rows):
+                tables_tree.item(item, values=values)
+            for values in table_rows[len(items):]:
+                tables_tree.insert('', tk.END, values=values)
+            if len(items) > len(table_rows):
+                tables_tree.delete(*items[len(table_rows):])
 
         # Update results text
         results_text = widgets.get('results_text')
         if results_text:
-            if settings.get('error'):
-                self._show_db_result(results_text, f"Error fetching settings: {settings['error']}")
-            else:
-                self._show_db_result(results_text, "Database information refreshed successfully.")
+            self._show_db_result(results_text, payload['result_message'])
 
     def _format_bytes(self, bytes_val: int) -> str:
         """Format bytes to human readable string"""
@@ -1273,10 +2035,17 @@ class InstanceWindow:
             bytes_val /= 1024
         return f"{bytes_val:.1f} PB"
 
-    def _format_pg_setting(self, value: str, unit: str) -> str:
-        """Format a PostgreSQL setting value with its unit"""
+    def _format_pg_setting(self, value: str, unit: str, number: Optional[float] = None) -> str:
+        """
+        Format a PostgreSQL setting value with its unit
+
+        Args:
+            value: Setting value as reported by PostgreSQL
+            unit: Setting unit, e.g. '8kB' or '' for none
+            number: value already parsed as a float, if the caller has it
+        """
         try:
-            val = float(value)
+            val = float(value) if number is None else number
             if unit == '8kB':
                 # Convert to MB for readability
                 mb = (val * 8) / 1024
@@ -1348,110 +2117,41 @@ class InstanceWindow:
 
         return recommendations
 
-    def _evaluate_pg_setting(self, setting_name: str, setting: dict, recommendations: dict) -> tuple:
-        """Evaluate if a PostgreSQL setting is optimal, returns (status_text, tag)"""
+    def _evaluate_pg_setting(self, setting_name: str, setting: dict, recommendations: dict,
+                             number: Optional[float] = None) -> tuple:
+        """
+        Evaluate if a PostgreSQL setting is optimal, returns (status_text, tag)
+
+        number is setting['value'] already parsed as a float, if the caller has it.
+        """
+        rule = _PG_SETTING_BANDS.get(setting_name)
         try:
-            value = float(setting['value'])
+            value = float(setting['value']) if number is None else number
             unit = setting['unit']
+        except (ValueError, TypeError, KeyError):
+            rule = None
+        if rule is None:
+            return ('--', 'info')
 
+        in_mb, bands = rule
+        if in_mb:
             # Convert to common unit (MB) for comparison
             if unit == '8kB':
-                value_mb = (value * 8) / 1024
+                value = (value * 8) / 1024
             elif unit == 'kB':
-                value_mb = value / 1024
-            elif unit == 'MB':
-                value_mb = value
-            else:
-                value_mb = value
-
-            if setting_name == 'shared_buffers':
-                # shared_buffers should be at least 256MB
-                if value_mb >= 256:
-                    return ('Good', 'good')
-                elif value_mb >= 128:
-                    return ('Low', 'warning')
-                else:
-                    return ('Too Low', 'bad')
-
-            elif setting_name == 'effective_cache_size':
-                # Should be at least 1GB
-                if value_mb >= 1024:
-                    return ('Good', 'good')
-                elif value_mb >= 512:
-                    return ('Low', 'warning')
-                else:
-                    return ('Too Low', 'bad')
-
-            elif setting_name == 'work_mem':
-                # 4-64MB is reasonable
-                if 4 <= value_mb <= 128:
-                    return ('Good', 'good')
-                elif value_mb < 4:
-                    return ('Too Low', 'warning')
-                else:
-                    return ('High', 'warning')
-
-            elif setting_name == 'maintenance_work_mem':
-                if value_mb >= 256:
-                    return ('Good', 'good')
-                elif value_mb >= 64:
-                    return ('OK', 'warning')
-                else:
-                    return ('Low', 'bad')
-
-            elif setting_name == 'random_page_cost':
-                # 1.1 for SSD, 4.0 for HDD
-                if value <= 1.5:
-                    return ('SSD', 'good')
-                elif value <= 2.0:
-                    return ('OK', 'info')
-                else:
-                    return ('HDD Default', 'warning')
-
-            elif setting_name == 'effective_io_concurrency':
-                if value >= 100:
-                    return ('SSD', 'good')
-                elif value >= 2:
-                    return ('OK', 'info')
-                else:
-                    return ('Default', 'warning')
-
-            elif setting_name == 'checkpoint_completion_target':
-                if value >= 0.9:
-                    return ('Good', 'good')
-                elif value >= 0.7:
-                    return ('OK', 'info')
-                else:
-                    return ('Low', 'warning')
-
-            elif setting_name == 'max_connections':
-                if 50 <= value <= 200:
-                    return ('Good', 'good')
-                elif value > 200:
-                    return ('High', 'warning')
-                else:
-                    return ('Low', 'warning')
-
-            elif setting_name == 'wal_buffers':
-                if value_mb >= 16:
-                    return ('Good', 'good')
-                else:
-                    return ('Default', 'info')
-
-        except (ValueError, TypeError, KeyError):
-            pass
+                value = value / 1024
 
+        for low, high, status, tag in bands:
+            if (low is None or value >= low) and (high is None or value <= high):
+                return (status, tag)
         return ('--', 'info')
 
     def _create_backup_tab(self, instance_id: int):
         """Create the Backup feature tab"""
         conn_info = self.open_connections[instance_id]
-        feature_notebook = conn_info['feature_notebook']
         instance = conn_info['instance']
 
-        tab = ttk.Frame(feature_notebook)
-        feature_notebook.add(tab, text="Backup")
-        conn_info['tabs']['backup'] = tab
+        tab = self._feature_tab(instance_id, 'backup', "Backup")
 
         # Apply dark mode colors
         is_dark = self.dark_mode_var.get()
@@ -1546,9 +2246,8 @@ class InstanceWindow:
         log_text.configure(state=tk.DISABLED)
 
         # Configure log tags
-        log_text.tag_configure('error', foreground='#ff6b6b')
-        log_text.tag_configure('warning', foreground='#ffa500')
-        log_text.tag_configure('success', foreground='#69db7c')
+        for name, options in _OPERATION_LOG_TAGS:
+            log_text.tag_configure(name, **options)
         log_text.tag_configure('info', foreground=text_fg)
 
         # Store widgets
@@ -1597,13 +2296,7 @@ class InstanceWindow:
         log_text.delete('1.0', tk.END)
         log_text.configure(state=tk.DISABLED)
 
-        def log_callback(message, level="info"):
-            def update():
-                log_text.configure(state=tk.NORMAL)
-                log_text.insert(tk.END, message + "\n", level)
-                log_text.configure(state=tk.DISABLED)
-                log_text.see(tk.END)
-            self.root.after(0, update)
+        log_callback = self._make_log_callback(log_text)
 
         def progress_callback(value, message=""):
             def update():
@@ -1727,12 +2420,9 @@ class InstanceWindow:
     def _create_restore_tab(self, instance_id: int):
         """Create the Restore feature tab"""
         conn_info = self.open_connections[instance_id]
-        feature_notebook = conn_info['feature_notebook']
         instance = conn_info['instance']
 
-        tab = ttk.Frame(feature_notebook)
-        feature_notebook.add(tab, text="Restore")
-        conn_info['tabs']['restore'] = tab
+        tab = self._feature_tab(instance_id, 'restore', "Restore")
 
         # Apply dark mode colors
         is_dark = self.dark_mode_var.get()
@@ -1899,9 +2589,8 @@ class InstanceWindow:
         log_text.configure(state=tk.DISABLED)
 
         # Configure log tags
-        log_text.tag_configure('error', foreground='#ff6b6b')
-        log_text.tag_configure('warning', foreground='#ffa500')
-        log_text.tag_configure('success', foreground='#69db7c')
+        for name, options in _OPERATION_LOG_TAGS:
+            log_text.tag_configure(name, **options)
         log_text.tag_configure('info', foreground=text_fg)
 
         # Store widgets
@@ -1980,13 +2669,7 @@ class InstanceWindow:
         log_text.delete('1.0', tk.END)
         log_text.configure(state=tk.DISABLED)
 
-        def log_callback(message, level="info"):
-            def update():
-                log_text.configure(state=tk.NORMAL)
-                log_text.insert(tk.END, message + "\n", level)
-                log_text.configure(state=tk.DISABLED)
-                log_text.see(tk.END)
-            self.root.after(0, update)
+        log_callback = self._make_log_callback(log_text)
 
         def progress_callback(value, message=""):
             def update():
@@ -2109,12 +2792,9 @@ class InstanceWindow:
     def _create_backup_restore_tab(self, instance_id: int):
         """Create the Backup & Restore (one-shot) feature tab"""
         conn_info = self.open_connections[instance_id]
-        feature_notebook = conn_info['feature_notebook']
         instance = conn_info['instance']
 
-        tab = ttk.Frame(feature_notebook)
-        feature_notebook.add(tab, text="Backup & Restore")
-        conn_info['tabs']['backup_restore'] = tab
+        tab = self._feature_tab(instance_id, 'backup_restore', "Backup & Restore")
 
         # Apply dark mode colors
         is_dark = self.dark_mode_var.get()
@@ -2257,9 +2937,8 @@ class InstanceWindow:
         log_text.configure(state=tk.DISABLED)
 
         # Configure log tags
-        log_text.tag_configure('error', foreground='#ff6b6b')
-        log_text.tag_configure('warning', foreground='#ffa500')
-        log_text.tag_configure('success', foreground='#69db7c')
+        for name, options in _OPERATION_LOG_TAGS:
+            log_text.tag_configure(name, **options)
         log_text.tag_configure('info', foreground=text_fg)
 
         # Store widgets
@@ -2346,13 +3025,7 @@ class InstanceWindow:
         log_text.delete('1.0', tk.END)
         log_text.configure(state=tk.DISABLED)
 
-        def log_callback(message, level="info"):
-            def update():
-                log_text.configure(state=tk.NORMAL)
-                log_text.insert(tk.END, message + "\n", level)
-                log_text.configure(state=tk.DISABLED)
-                log_text.see(tk.END)
-            self.root.after(0, update)
+        log_callback = self._make_log_callback(log_text)
 
         def progress_callback(value, message=""):
             def update():
@@ -2525,12 +3198,9 @@ class InstanceWindow:
     def _create_history_tab(self, instance_id: int):
         """Create the Operation History tab"""
         conn_info = self.open_connections[instance_id]
-        feature_notebook = conn_info['feature_notebook']
         instance = conn_info['instance']
 
-        tab = ttk.Frame(feature_notebook)
-        feature_notebook.add(tab, text="History")
-        conn_info['tabs']['history'] = tab
+        tab = self._feature_tab(instance_id, 'history', "History")
 
         # Apply dark mode colors
         is_dark = self.dark_mode_var.get()
@@ -2582,9 +3252,8 @@ class InstanceWindow:
         log_text.configure(state=tk.DISABLED)
 
         # Configure log tags
-        log_text.tag_configure('error', foreground='#ff6b6b')
-        log_text.tag_configure('warning', foreground='#ffa500')
-        log_text.tag_configure('success', foreground='#69db7c')
+        for name, options in _OPERATION_LOG_TAGS:
+            log_text.tag_configure(name, **options)
         log_text.tag_configure('info', foreground=text_fg)
 
         # Store logs data for selection
@@ -2641,7 +3310,9 @@ class InstanceWindow:
             log_text.configure(state=tk.NORMAL)
             log_text.delete('1.0', tk.END)
 
-            log_content = log.get('log_text', 'No log content available')
+            # The list only holds summaries; load the full log for this entry
+            full_log = self.instance_manager.get_operation_log(log['id']) or {}
+            log_content = full_log.get('log_text') or 'No log content available'
             log_text.insert(tk.END, log_content)
 
             log_text.configure(state=tk.DISABLED)
@@ -2685,6 +3356,7 @@ class InstanceWindow:
         dialog = ConnectionDialog(self.root, self.instance_manager,
                                    dark_mode=self.dark_mode_var.get())
         if dialog.result:
+            self._groups_cache = None
             self._refresh_connection_tree()
             self._refresh_all_backup_restore_destinations()
 
@@ -2699,6 +3371,7 @@ class InstanceWindow:
             dialog = ConnectionDialog(self.root, self.instance_manager, instance,
                                        dark_mode=self.dark_mode_var.get())
             if dialog.result:
+                self._groups_cache = None
                 self._refresh_connection_tree()
                 self._refresh_all_backup_restore_destinations()
                 # Update open tab if connected
@@ -2723,6 +3396,7 @@ class InstanceWindow:
                 self._close_connection(instance_id)
 
             self.instance_manager.delete_instance(instance_id)
+            self._groups_cache = None
             self._refresh_connection_tree()
             self._refresh_all_backup_restore_destinations()
 
@@ -2759,6 +3433,7 @@ class InstanceWindow:
                 json_data = f.read()
 
             success, errors, messages = self.instance_manager.import_instances(json_data)
+            self._groups_cache = None
             self._refresh_connection_tree()
             self._refresh_all_backup_restore_destinations()
 
@@ -3032,6 +3707,13 @@ class InstanceWindow:
             if widget_class == "Text":
                 widget.configure(bg=bg, fg=fg, insertbackground=fg,
                                selectbackground=select_bg, selectforeground=fg)
+                # Theme-dependent log tags; the rest come from the shared tables
+                tags = widget.tag_names()
+                if 'info' in tags:
+                    widget.tag_configure('info', foreground=fg)
+                if 'highlight' in tags:
+                    widget.tag_configure('highlight',
+                                         background=_log_highlight_background(self.dark_mode_var.get()))
             elif widget_class == "Listbox":
                 widget.configure(bg=bg, fg=fg,
                                selectbackground=select_bg, selectforeground=fg)
@@ -3075,17 +3757,33 @@ class InstanceWindow:
         # Only save when it's the root window being configured
         if event.widget == self.root:
             # Debounce: cancel previous pending save and schedule a new one
-            if self._geometry_save_pending:
-                self.root.after_cancel(self._geometry_save_pending)
+            if self._geometry_after_id:
+                self.root.after_cancel(self._geometry_after_id)
             # Save after 500ms of no resize/move activity
-            self._geometry_save_pending = self.root.after(500, self._save_geometry_debounced)
+            self._geometry_after_id = self.root.after(500, self._save_geometry_debounced)
 
     def _save_geometry_debounced(self):
         """Save geometry after debounce period."""
-        self._geometry_save_pending = False
+        self._geometry_after_id = None
         self._save_geometry()
         self._save_layout()
 
+    def _save_window_setting(self, key: str, value: str):
+        """Queue a window-state setting for the next flush unless it is unchanged"""
+        if self._saved_window_state.get(key) == value:
+            self._dirty_settings.pop(key, None)
+            return
+        self._dirty_settings[key] = value
+
+    def _flush_settings(self):
+        """Write all queued window-state settings in one transaction"""
+        if not self._dirty_settings:
+            return
+        dirty = self._dirty_settings
+        self._dirty_settings = {}
+        self.instance_manager.set_settings(dirty)
+        self._saved_window_state.update(dirty)
+
     def _start_autosave(self):
         """Start periodic autosave of window state."""
         def autosave():
@@ -3094,6 +3792,7 @@ class InstanceWindow:
                 self._save_layout()
                 self._save_active_tab()
                 self._save_open_connections()
+                self._flush_settings()
             except Exception:
                 pass  # Silently ignore errors during autosave
             # Schedule next autosave in 30 seconds
@@ -3149,7 +3848,7 @@ class InstanceWindow:
         """Save current window geometry."""
         try:
             geometry = self.root.geometry()
-            self.instance_manager.set_setting("window_geometry", geometry)
+            self._save_window_setting("window_geometry", geometry)
         except Exception:
             pass
 
@@ -3167,19 +3866,21 @@ class InstanceWindow:
         """Save paned window sash positions."""
         try:
             sash_pos = self.main_paned.sashpos(0)
-            self.instance_manager.set_setting("layout_main_sash", str(sash_pos))
+            self._save_window_setting("layout_main_sash", str(sash_pos))
         except Exception:
             pass
 
     def _save_active_tab(self):
         """Save the currently active connection tab index."""
+        if self._pending_restores:
+            return
         try:
             current_tab = self.connection_notebook.select()
             if current_tab:
                 tabs = self.connection_notebook.tabs()
                 for idx, tab_id in enumerate(tabs):
                     if tab_id == current_tab:
-                        self.instance_manager.set_setting("last_active_tab", str(idx))
+                        self._save_window_setting("last_active_tab", str(idx))
                         return
         except Exception:
             pass
@@ -3198,6 +3899,8 @@ class InstanceWindow:
 
     def _save_open_connections(self):
         """Save list of open connection IDs and their active feature tabs."""
+        if self._pending_restores:
+            return
         try:
             import json
             # Save connection IDs along with their active feature tab index
@@ -3215,7 +3918,7 @@ class InstanceWindow:
                     pass
                 connection_state[str(instance_id)] = {'feature_tab': feature_tab_idx}
 
-            self.instance_manager.set_setting("open_connections", json.dumps(connection_state))
+            self._save_window_setting("open_connections", json.dumps(connection_state))
         except Exception:
             pass
 
@@ -3228,29 +3931,58 @@ class InstanceWindow:
                 connection_state = json.loads(saved)
                 # Handle old format (list of IDs) and new format (dict with state)
                 if isinstance(connection_state, list):
-                    # Old format - just IDs
-                    for instance_id in connection_state:
-                        instance = self.instance_manager.get_instance(instance_id)
-                        if instance:
-                            self._open_connection(instance)
-                else:
-                    # New format - dict with state
-                    for instance_id_str, state in connection_state.items():
-                        instance_id = int(instance_id_str)
-                        instance = self.instance_manager.get_instance(instance_id)
-                        if instance:
-                            self._open_connection(instance)
-                            # Restore feature tab after a delay
-                            feature_tab_idx = state.get('feature_tab', 0)
-                            if feature_tab_idx > 0:
-                                self.root.after(300, lambda iid=instance_id, idx=feature_tab_idx:
-                                               self._restore_feature_tab(iid, idx))
-
-                # Restore active connection tab after opening all connections
-                self._restore_active_tab()
+                    connection_state = {str(instance_id): {} for instance_id in connection_state}
+
+                # Connect all executors concurrently (each may be an SSH
+                # handshake); tabs are still built on this thread, in order
+                pending = []
+                pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='odoobench-connect')
+                for instance_id_str, state in connection_state.items():
+                    instance = self.instance_manager.get_instance(int(instance_id_str))
+                    if instance:
+                        exec_config = self.instance_manager.get_executor_config(instance['id'])
+                        future = pool.submit(create_executor, exec_config)
+                        pending.append((instance, future, state.get('feature_tab', 0)))
+                pool.shutdown(wait=False)
+                self._pending_restores = pending
+
+                if not pending:
+                    self._restore_active_tab()
+                for _, future, _ in pending:
+                    future.add_done_callback(
+                        lambda f: self.root.after(0, self._finish_restored_connections, pending))
         except Exception:
             pass
 
+    def _finish_restored_connections(self, pending: list):
+        """
+        Open tabs for restored connections whose executors are ready, keeping
+        their saved order, then restore the active tab once all are open.
+
+        Args:
+            pending: (instance, executor future, feature tab index) tuples
+                still to open, in saved order
+        """
+        opened = False
+        while pending and pending[0][1].done():
+            instance, future, feature_tab_idx = pending.pop(0)
+            opened = True
+            try:
+                executor = future.result()
+            except Exception as e:
+                messagebox.showerror("Connection Error", f"Failed to connect:\n{e}")
+                continue
+
+            self._finish_open_connection(instance, executor)
+            # Restore feature tab after a delay
+            if feature_tab_idx > 0:
+                self.root.after(300, lambda iid=instance['id'], idx=feature_tab_idx:
+                               self._restore_feature_tab(iid, idx))
+
+        # Restore active connection tab after opening all connections
+        if opened and not pending:
+            self._restore_active_tab()
+
     def _restore_feature_tab(self, instance_id: int, tab_idx: int):
         """Restore the active feature tab for a connection."""
         try:
@@ -3269,6 +4001,10 @@ class InstanceWindow:
         self._save_layout()
         self._save_active_tab()
         self._save_open_connections()
+        try:
+            self._flush_settings()
+        except Exception:
+            pass
 
         # Disconnect all open connections
         for instance_id in list(self.open_connections.keys()):
@@ -3277,6 +4013,7 @@ class InstanceWindow:
             except Exception:
                 pass
 
+        self.instance_manager.close()
         self.root.destroy()
 
 
@@ -51,6 +51,8 @@ setup(
     ],
     extras_require={
         "gui": ["tkinter"],  # Note: tkinter usually comes with Python
+        "inotify": ["inotify_simple>=1.3.5"],  # Event-driven local log following
+        "postgres": ["psycopg2-binary>=2.9"],  # Direct queries instead of local psql
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",